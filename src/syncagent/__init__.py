@@ -1,3 +1,3 @@
 """SyncAgent - Zero-Knowledge E2EE file synchronization system."""
 
-__version__ = "0.1.0"
+__version__ = "0.1.23"
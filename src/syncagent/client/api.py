@@ -130,11 +130,13 @@ class ChangesResult:
 class HTTPClient:
     """HTTP client for SyncAgent server API."""
 
-    def __init__(self, config: ServerConfig) -> None:
+    def __init__(self, config: ServerConfig, transport: httpx.BaseTransport | None = None) -> None:
         """Initialize the sync client.
 
         Args:
             config: Server configuration with URL, token, and settings.
+            transport: Optional httpx transport (e.g. to inject failures in
+                tests). Defaults to a regular network transport.
         """
         self._config = config
         self._server_url = config.server_url
@@ -147,6 +149,7 @@ class HTTPClient:
             timeout=self._timeout,
             headers={"Authorization": f"Bearer {self._token}"},
             verify=self._verify_ssl,
+            transport=transport,
         )
 
     def close(self) -> None:
@@ -6,45 +6,68 @@ This module provides shared configuration functions used across CLI commands.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+# Environment variable overriding the configuration directory
+CONFIG_DIR_ENV = "SYNCAGENT_CONFIG_DIR"
+
 
 def get_config_dir() -> Path:
     """Get the configuration directory for SyncAgent.
 
     Returns:
-        Path to ~/.syncagent or equivalent.
+        Path from $SYNCAGENT_CONFIG_DIR if set, else ~/.syncagent.
     """
+    override = os.environ.get(CONFIG_DIR_ENV)
+    if override:
+        return Path(override)
     return Path.home() / ".syncagent"
 
 
-def get_config_file() -> Path:
-    """Get the path to the config file."""
-    return get_config_dir() / "config.json"
+def get_config_file(config_dir: Path | None = None) -> Path:
+    """Get the path to the config file.
+
+    Args:
+        config_dir: Config directory (default: get_config_dir()).
+    """
+    return (config_dir or get_config_dir()) / "config.json"
 
 
-def load_config() -> dict[str, str]:
-    """Load configuration from config file."""
-    config_file = get_config_file()
+def load_config(config_dir: Path | None = None) -> dict[str, str]:
+    """Load configuration from config file.
+
+    Args:
+        config_dir: Config directory (default: get_config_dir()).
+    """
+    config_file = get_config_file(config_dir)
     if config_file.exists():
         return dict(json.loads(config_file.read_text()))
     return {}
 
 
-def save_config(config: dict[str, str]) -> None:
-    """Save configuration to config file."""
-    config_file = get_config_file()
+def save_config(config: dict[str, str], config_dir: Path | None = None) -> None:
+    """Save configuration to config file.
+
+    Args:
+        config: Configuration to save.
+        config_dir: Config directory (default: get_config_dir()).
+    """
+    config_file = get_config_file(config_dir)
     config_file.parent.mkdir(parents=True, exist_ok=True)
     config_file.write_text(json.dumps(config, indent=2))
 
 
-def get_sync_folder() -> Path:
+def get_sync_folder(config_dir: Path | None = None) -> Path:
     """Get the sync folder path.
 
+    Args:
+        config_dir: Config directory (default: get_config_dir()).
+
     Returns:
         Path to the sync folder (configured or default ~/SyncAgent).
     """
-    config = load_config()
+    config = load_config(config_dir)
     if config.get("sync_folder"):
         return Path(config["sync_folder"]).expanduser().resolve()
     return Path.home() / "SyncAgent"
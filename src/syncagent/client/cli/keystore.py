@@ -15,6 +15,7 @@ Commands:
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -26,6 +27,7 @@ from syncagent.client.cli.config import (
     save_config,
 )
 from syncagent.client.keystore import (
+    KeyStore,
     KeyStoreError,
     create_keystore,
     load_keystore,
@@ -73,18 +75,11 @@ def init() -> None:
     sync_path = Path(sync_folder_input).expanduser().resolve()
 
     try:
-        keystore = create_keystore(password, config_dir)
-
-        # Create sync folder if it doesn't exist
-        if not sync_path.exists():
-            sync_path.mkdir(parents=True)
+        created_folder = not sync_path.exists()
+        keystore = initialize(config_dir, password, sync_path)
+        if created_folder:
             click.echo(f"\nCreated sync folder: {sync_path}")
 
-        # Save sync folder to config
-        config = load_config()
-        config["sync_folder"] = str(sync_path)
-        save_config(config)
-
         click.echo("\nSyncAgent initialized successfully!")
         click.echo(f"Key ID: {keystore.key_id}")
         click.echo(f"Config directory: {config_dir}")
@@ -108,6 +103,34 @@ def init() -> None:
         sys.exit(1)
 
 
+def initialize(config_dir: Path, password: str, sync_folder: Path) -> KeyStore:
+    """Create the keystore and sync folder, and save the sync folder to config.
+
+    This is the body of the 'init' command without prompts and output, so
+    callers that already know the answers (e.g. tests) can skip Click.
+
+    Args:
+        config_dir: Config directory to create the keyfile in.
+        password: Master password protecting the encryption key.
+        sync_folder: Resolved sync folder path, created if missing.
+
+    Returns:
+        The new, unlocked keystore.
+
+    Raises:
+        KeyStoreError: If the keystore already exists.
+    """
+    keystore = create_keystore(password, config_dir)
+
+    sync_folder.mkdir(parents=True, exist_ok=True)
+
+    config = load_config(config_dir)
+    config["sync_folder"] = str(sync_folder)
+    save_config(config, config_dir)
+
+    return keystore
+
+
 @click.command()
 @click.option(
     "--force",
@@ -177,11 +200,18 @@ def unlock() -> None:
 
 
 @click.command("export-key")
-def export_key() -> None:
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the key as a JSON object on stdout.",
+)
+def export_key(as_json: bool) -> None:
     """Export the encryption key.
 
     Outputs the base64-encoded encryption key.
     Use this to transfer your key to another device.
+    With --json, only {"key": "<base64>"} is written to stdout.
 
     WARNING: Keep this key secret! Anyone with this key
     can decrypt your files.
@@ -192,11 +222,15 @@ def export_key() -> None:
         click.echo("Error: SyncAgent not initialized. Run 'syncagent init' first.", err=True)
         sys.exit(1)
 
-    password = click.prompt("Enter master password", hide_input=True)
+    # Keep stdout machine-readable in JSON mode
+    password = click.prompt("Enter master password", hide_input=True, err=as_json)
 
     try:
         keystore = load_keystore(password, config_dir)
         key_b64 = keystore.export_key()
+        if as_json:
+            click.echo(json.dumps({"key": key_b64}))
+            return
         click.echo("\nEncryption key (keep secret!):")
         click.echo(key_b64)
     except KeyStoreError as e:
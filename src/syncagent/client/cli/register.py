@@ -8,9 +8,13 @@ Commands:
 
 from __future__ import annotations
 
+import platform
+import socket
 import sys
+from pathlib import Path
 
 import click
+import httpx
 
 from syncagent.client.cli.config import (
     get_config_dir,
@@ -20,6 +24,63 @@ from syncagent.client.cli.config import (
 )
 
 
+class RegistrationError(Exception):
+    """Raised when the server refuses to register the machine."""
+
+
+class DuplicateMachineNameError(RegistrationError):
+    """Raised when the machine name is already taken on the server."""
+
+
+def register_machine(config_dir: Path, server: str, token: str, machine_name: str) -> str:
+    """Register a machine with the server and save the result to config.
+
+    This is the body of the 'register' command without prompts and output,
+    so callers that already know the answers (e.g. tests) can skip Click.
+
+    Args:
+        config_dir: Initialized config directory to save the registration in.
+        server: Server URL.
+        token: Invitation token from the server admin.
+        machine_name: Sanitized machine name.
+
+    Returns:
+        The machine name assigned by the server.
+
+    Raises:
+        DuplicateMachineNameError: If the machine name already exists.
+        RegistrationError: If the server rejects the registration.
+        httpx.RequestError: If the server cannot be reached.
+    """
+    response = httpx.post(
+        f"{server.rstrip('/')}/api/machines/register",
+        json={
+            "name": machine_name,
+            "platform": platform.system().lower(),
+            "invitation_token": token,
+        },
+        timeout=30.0,
+    )
+
+    if response.status_code == 401:
+        raise RegistrationError("Invalid or expired invitation token.")
+    if response.status_code == 409:
+        raise DuplicateMachineNameError(f"Machine name '{machine_name}' already exists on server.")
+    if response.status_code != 201:
+        raise RegistrationError(response.json().get("detail", "Unknown error"))
+
+    data = response.json()
+    name: str = data["machine"]["name"]
+
+    config = load_config(config_dir)
+    config["server_url"] = server.rstrip("/")
+    config["auth_token"] = data["token"]
+    config["machine_name"] = name
+    save_config(config, config_dir)
+
+    return name
+
+
 @click.command()
 @click.option(
     "--server",
@@ -42,11 +103,6 @@ def register(server: str, token: str, name: str | None) -> None:
     Requires an invitation token from the server admin.
     Creates a connection between this machine and the server.
     """
-    import platform
-    import socket
-
-    import httpx
-
     config_dir = get_config_dir()
 
     # Check if initialized
@@ -78,48 +134,17 @@ def register(server: str, token: str, name: str | None) -> None:
             click.echo(f"Note: Machine name sanitized to '{sanitized}'")
             machine_name = sanitized
 
-    machine_platform = platform.system().lower()
-
     click.echo(f"\nRegistering machine '{machine_name}' with server...")
 
-    # Call the registration API
     try:
-        response = httpx.post(
-            f"{server.rstrip('/')}/api/machines/register",
-            json={
-                "name": machine_name,
-                "platform": machine_platform,
-                "invitation_token": token,
-            },
-            timeout=30.0,
-        )
-
-        if response.status_code == 401:
-            click.echo("Error: Invalid or expired invitation token.", err=True)
-            sys.exit(1)
-        elif response.status_code == 409:
-            click.echo(f"Error: Machine name '{machine_name}' already exists on server.", err=True)
-            click.echo("Use --name to specify a different name.")
-            sys.exit(1)
-        elif response.status_code != 201:
-            detail = response.json().get("detail", "Unknown error")
-            click.echo(f"Error: {detail}", err=True)
-            sys.exit(1)
-
-        data = response.json()
-        auth_token = data["token"]
-        machine_info = data["machine"]
-
-        # Save configuration
-        config["server_url"] = server.rstrip("/")
-        config["auth_token"] = auth_token
-        config["machine_name"] = machine_info["name"]
-        save_config(config)
-
-        click.echo("\nMachine registered successfully!")
-        click.echo(f"Server: {server}")
-        click.echo(f"Machine name: {machine_info['name']}")
-
+        registered_name = register_machine(config_dir, server, token, machine_name)
+    except DuplicateMachineNameError as e:
+        click.echo(f"Error: {e}", err=True)
+        click.echo("Use --name to specify a different name.")
+        sys.exit(1)
+    except RegistrationError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
     except httpx.ConnectError:
         click.echo(f"Error: Could not connect to server at {server}", err=True)
         click.echo("Make sure the server is running and accessible.")
@@ -127,3 +152,7 @@ def register(server: str, token: str, name: str | None) -> None:
     except httpx.RequestError as e:
         click.echo(f"Error: Request failed: {e}", err=True)
         sys.exit(1)
+
+    click.echo("\nMachine registered successfully!")
+    click.echo(f"Server: {server}")
+    click.echo(f"Machine name: {registered_name}")
@@ -4,6 +4,9 @@ Spec: docs/cli/sync.md
 
 Commands:
 - sync: Synchronize files with the server
+
+Functions:
+- run_sync: Sync session used by the command, callable without Click
 """
 
 from __future__ import annotations
@@ -13,7 +16,7 @@ import sys
 import threading
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
@@ -24,6 +27,9 @@ from syncagent.client.cli.config import (
 )
 from syncagent.client.keystore import KeyStoreError, load_keystore
 
+if TYPE_CHECKING:
+    from syncagent.client.sync import SyncResult
+
 
 class StatusLineAwareHandler(logging.Handler):
     """Logging handler that coordinates with the status line display.
@@ -64,26 +70,6 @@ def sync(watch: bool, no_progress: bool) -> None:
     Uploads local changes and downloads remote changes.
     Use --watch to continuously monitor for changes.
     """
-    from syncagent.client.api import HTTPClient
-    from syncagent.client.notifications import notify_conflict
-    from syncagent.client.state import LocalSyncState
-    from syncagent.client.status import StatusReporter, StatusUpdate
-    from syncagent.client.sync import (
-        NETWORK_EXCEPTIONS,
-        ChangeScanner,
-        EventQueue,
-        FileWatcher,
-        RemoteChanges,
-        SyncEvent,
-        SyncEventType,
-        TransferType,
-        WorkerPool,
-        emit_events,
-        wait_for_network,
-    )
-    from syncagent.core.config import ServerConfig
-    from syncagent.core.types import SyncState as SyncStateEnum
-
     config_dir = get_config_dir()
 
     # Check if initialized
@@ -106,8 +92,56 @@ def sync(watch: bool, no_progress: bool) -> None:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
+    run_sync(config_dir, keystore.encryption_key, watch=watch, no_progress=no_progress)
+
+
+def run_sync(
+    config_dir: Path,
+    encryption_key: bytes,
+    *,
+    watch: bool = False,
+    no_progress: bool = False,
+) -> SyncResult:
+    """Run a sync session for an initialized and registered client.
+
+    This is the body of the 'sync' command without prerequisite checks and
+    password prompt, so callers that already hold the unlocked encryption
+    key (e.g. tests) can sync without going through Click.
+
+    Args:
+        config_dir: Config directory holding config.json and state.db.
+        encryption_key: Unlocked encryption key.
+        watch: Keep watching for changes after the initial sync.
+        no_progress: Disable progress output.
+
+    Returns:
+        SyncResult for the initial sync (or the last batch in watch mode).
+    """
+    from syncagent.client.api import HTTPClient
+    from syncagent.client.notifications import notify_conflict
+    from syncagent.client.state import LocalSyncState
+    from syncagent.client.status import StatusReporter, StatusUpdate
+    from syncagent.client.sync import (
+        NETWORK_EXCEPTIONS,
+        ChangeScanner,
+        EventQueue,
+        FileWatcher,
+        RemoteChanges,
+        SyncEvent,
+        SyncEventType,
+        SyncResult,
+        TransferType,
+        WorkerPool,
+        emit_events,
+        wait_for_network,
+    )
+    from syncagent.core.config import ServerConfig
+    from syncagent.core.types import SyncState as SyncStateEnum
+
+    config = load_config(config_dir)
+
     # Get sync folder
-    sync_folder = get_sync_folder()
+    sync_folder = get_sync_folder(config_dir)
     if not sync_folder.exists():
         sync_folder.mkdir(parents=True)
         click.echo(f"Created sync folder: {sync_folder}")
@@ -134,7 +168,7 @@ def sync(watch: bool, no_progress: bool) -> None:
     # Create worker pool for concurrent transfers
     pool = WorkerPool(
         client=client,
-        encryption_key=keystore.encryption_key,
+        encryption_key=encryption_key,
         base_path=sync_folder,
         state=local_state,
     )
@@ -442,3 +476,11 @@ def sync(watch: bool, no_progress: bool) -> None:
         syncagent_logger.addHandler(handler)
     syncagent_logger.setLevel(original_level)
     syncagent_logger.propagate = original_propagate
+
+    return SyncResult(
+        uploaded=list(uploaded),
+        downloaded=list(downloaded),
+        deleted=list(deleted),
+        conflicts=list(conflicts),
+        errors=list(errors),
+    )
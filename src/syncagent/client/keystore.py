@@ -10,6 +10,7 @@ This module provides:
 from __future__ import annotations
 
 import base64
+import binascii
 import contextlib
 import json
 import os
@@ -115,8 +116,9 @@ class KeyStore:
             KeyStoreError: If the key is invalid.
         """
         try:
-            key = base64.b64decode(key_b64)
-        except Exception as e:
+            # Strict: characters outside the alphabet are errors, not skipped
+            key = binascii.a2b_base64(key_b64.strip(), strict_mode=True)
+        except (binascii.Error, ValueError) as e:
             raise KeyStoreError("Invalid key format: not valid base64") from e
 
         if len(key) != 32:
@@ -200,11 +200,12 @@ class StatusReporter:
         """Stop the status reporter."""
         self._should_run = False
 
-        # Close connection if open
+        # Close connection if open (best effort, the thread is a daemon)
         if self._loop and self._ws:
-            asyncio.run_coroutine_threadsafe(
-                self._close_connection(), self._loop
-            ).result(timeout=5.0)
+            with contextlib.suppress(TimeoutError):
+                asyncio.run_coroutine_threadsafe(
+                    self._close_connection(), self._loop
+                ).result(timeout=5.0)
 
         if self._thread:
             self._thread.join(timeout=5.0)
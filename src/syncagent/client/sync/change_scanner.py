@@ -402,30 +402,39 @@ class ChangeScanner:
         # Track files found on disk
         found_paths: set[str] = set()
 
-        # Walk the directory
-        for root_str, dirs, files in os.walk(self._base_path):
-            root = Path(root_str)
-
-            # Filter out ignored directories (including symlinks)
-            dirs[:] = [
-                d for d in dirs
-                if not ignore.should_ignore(root / d, self._base_path)
-            ]
+        # Walk the directory with os.scandir: DirEntry answers is_symlink() and
+        # is_dir() from the directory listing, so a file costs a single stat().
+        # Symlinks are skipped, never followed, so the walk cannot loop.
+        pending: list[tuple[str, str]] = [(str(self._base_path), "")]
+        while pending:
+            dir_path, rel_dir = pending.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError as e:
+                # Like os.walk: skip directories that cannot be listed
+                logger.debug(f"Cannot scan directory {dir_path}: {e}")
+                continue
+
+            subdirs: list[tuple[str, str]] = []
+            for entry in entries:
+                # Skip symlinks (SC-22)
+                if entry.is_symlink():
+                    continue
 
-            for filename in files:
-                file_path = root / filename
+                relative_path = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not ignore.matches(relative_path, is_dir=True):
+                        subdirs.append((entry.path, relative_path + "/"))
+                    continue
 
-                # Skip symlinks and ignored patterns
-                if file_path.is_symlink() or ignore.should_ignore(file_path, self._base_path):
+                if ignore.matches(relative_path, is_dir=False):
                     continue
 
-                relative_path = str(file_path.relative_to(self._base_path))
-                # Normalize path separators
-                relative_path = relative_path.replace("\\", "/")
                 found_paths.add(relative_path)
 
                 local_file = self._state.get_file(relative_path)
-                stat = file_path.stat()
+                stat = entry.stat(follow_symlinks=False)
 
                 if local_file is None:
                     # New file (not tracked in DB)
@@ -450,6 +459,9 @@ class ChangeScanner:
                         ))
                     # else: file is SYNCED, no action needed
 
+            # Visit subdirectories in listing order, top-down like os.walk
+            pending.extend(reversed(subdirs))
+
         # Check for deleted files (tracked in DB but not on disk)
         tracked_files = self._state.list_files()
         for local_file in tracked_files:
@@ -73,23 +73,39 @@ class IgnorePatterns:
             return False
 
         rel_str = str(rel_path).replace("\\", "/")
+        return self.matches(rel_str, path.is_dir())
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check a relative path against the patterns, without touching disk.
+
+        Symlinks are not detected here: callers that already know the entry
+        type (e.g. from os.scandir) skip them and call this directly.
+
+        Args:
+            rel_path: Path relative to the sync directory, "/"-separated.
+            is_dir: Whether the path is a directory.
+
+        Returns:
+            True if the path should be ignored.
+        """
+        name = rel_path.rpartition("/")[2]
 
         for pattern in self._patterns:
             # Handle directory-only patterns (ending with /)
             if pattern.endswith("/"):
                 pattern = pattern[:-1]
-                if path.is_dir() and fnmatch.fnmatch(rel_str, pattern):
+                if is_dir and fnmatch.fnmatch(rel_path, pattern):
                     return True
                 # Also match if any parent matches
-                if fnmatch.fnmatch(rel_str.split("/")[0], pattern):
+                if fnmatch.fnmatch(rel_path.split("/")[0], pattern):
                     return True
             # Handle ** patterns
             elif "**" in pattern:
                 # Simple glob match for **
-                if fnmatch.fnmatch(rel_str, pattern):
+                if fnmatch.fnmatch(rel_path, pattern):
                     return True
             # Standard pattern or filename match
-            elif fnmatch.fnmatch(rel_str, pattern) or fnmatch.fnmatch(path.name, pattern):
+            elif fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern):
                 return True
 
         return False
@@ -45,7 +45,9 @@ class DeleteWorker(BaseWorker):
 
     Handles both directions:
     - LOCAL_DELETED events: Propagate deletion to server
-    - REMOTE_DELETED events: Delete local file
+    - REMOTE_DELETED events: Delete local file, then prune parent
+      directories left empty (so a folder deleted on the server
+      disappears locally instead of leaving an empty tree behind)
 
     Usage:
         worker = DeleteWorker(client, base_path)
@@ -119,6 +121,7 @@ class DeleteWorker(BaseWorker):
                         local_path.unlink()
                     result.deleted_local = True
                     logger.info(f"Deleted locally: {relative_path}")
+                    self._prune_empty_parents(local_path)
                 except Exception as e:
                     logger.error(f"Failed to delete locally: {relative_path}: {e}")
                     raise
@@ -132,3 +135,23 @@ class DeleteWorker(BaseWorker):
                 self._state.mark_deleted(relative_path)
 
         return result
+
+    def _prune_empty_parents(self, local_path: Path) -> None:
+        """Remove directories emptied by a remote deletion.
+
+        Walks up from the deleted path towards the sync root, removing each
+        parent with rmdir(). Stops at the first directory that still holds
+        entries, so local files that were never synced are never touched.
+
+        Args:
+            local_path: Absolute path of the entry that was just deleted.
+        """
+        for parent in local_path.parents:
+            if parent == self._base_path or self._base_path not in parent.parents:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                # Not empty (or already gone/recreated concurrently)
+                break
+            logger.debug(f"Removed empty directory: {parent}")
@@ -6,6 +6,7 @@ This module provides:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -20,11 +21,11 @@ from syncagent.client.sync.types import (
     UploadError,
     UploadResult,
 )
-from syncagent.core.chunking import Chunk, chunk_file
-from syncagent.core.crypto import compute_file_hash, encrypt_chunk
+from syncagent.core.chunking import Chunk, chunk_bytes
+from syncagent.core.crypto import encrypt_chunk
 
 if TYPE_CHECKING:
-    from syncagent.client.api import HTTPClient
+    from syncagent.client.api import HTTPClient, ServerFile
     from syncagent.client.state import LocalSyncState
 
 from syncagent.client.api import ConflictError
@@ -120,26 +121,55 @@ class FileUploader:
         logger.info(f"Uploading {relative_path}")
 
         # Phase 15.7: Pre-upload version check
+        server_file: ServerFile | None = None
         if self._enable_early_conflict_check and parent_version is not None:
-            self._check_server_version(relative_path, parent_version, ConflictType.PRE_TRANSFER)
+            server_file = self._check_server_version(
+                relative_path, parent_version, ConflictType.PRE_TRANSFER
+            )
 
         # Notify hashing start
         if self._on_hashing_start:
             self._on_hashing_start()
 
         try:
-            # Chunk the file (computes chunk hashes)
-            chunks = list(chunk_file(local_path))
+            # Read the file once: chunking, the file hash and the size all
+            # come from the same bytes
+            data = local_path.read_bytes()
+            chunks = list(chunk_bytes(data))
             chunk_hashes = [c.hash for c in chunks]
-
-            # Calculate file hash
-            content_hash = compute_file_hash(local_path)
-            size = local_path.stat().st_size
+            content_hash = hashlib.sha256(data).hexdigest()
+            size = len(data)
+            del data
         finally:
             # Notify hashing end (always, even on error)
             if self._on_hashing_end:
                 self._on_hashing_end()
 
+        # Content unchanged on an update (e.g. only the mtime moved): record the
+        # new local stats instead of committing an identical version.
+        if server_file is not None and server_file.content_hash == content_hash:
+            logger.info(f"{relative_path} unchanged (same content hash), skipping upload")
+            if self._state:
+                # Drop progress left by an earlier interrupted upload
+                self._state.clear_upload_progress(relative_path)
+                stat = local_path.stat()
+                self._state.mark_synced(
+                    relative_path,
+                    server_file_id=server_file.id,
+                    server_version=server_file.version,
+                    chunk_hashes=chunk_hashes,
+                    local_mtime=stat.st_mtime,
+                    local_size=stat.st_size,
+                )
+            return UploadResult(
+                path=relative_path,
+                server_file_id=server_file.id,
+                server_version=server_file.version,
+                chunk_hashes=chunk_hashes,
+                size=size,
+                content_hash=content_hash,
+            )
+
         # Check for existing upload progress (resume support)
         already_uploaded: set[str] = set()
         if self._state:
@@ -305,7 +335,7 @@ class FileUploader:
         relative_path: str,
         expected_version: int,
         conflict_type: ConflictType,
-    ) -> None:
+    ) -> ServerFile:
         """Check if server version matches expected (Phase 15.7).
 
         This allows early conflict detection to avoid wasting bandwidth
@@ -316,6 +346,9 @@ class FileUploader:
             expected_version: Version we're uploading against.
             conflict_type: When this check is happening (pre/mid transfer).
 
+        Returns:
+            The server's metadata for the file.
+
         Raises:
             EarlyConflictError: If server version doesn't match expected.
         """
@@ -342,6 +375,7 @@ class FileUploader:
                 f"Version check passed for {relative_path}: v{actual_version} "
                 f"({conflict_type.name})"
             )
+            return server_file
 
         except NotFoundError:
             # File was deleted on server - also a conflict for updates
@@ -16,7 +16,7 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, insert, select, update
 from sqlalchemy.orm import Session, joinedload
 
 from syncagent.server.models import (
@@ -498,36 +498,8 @@ class Database:
                 session.commit()
                 return 1
 
-            # No exact match - try as folder prefix
-            folder_path = path if path.endswith("/") else path + "/"
-            stmt = select(FileMetadata).where(
-                FileMetadata.path.startswith(folder_path),
-                FileMetadata.deleted_at.is_(None),
-            )
-            files = list(session.execute(stmt).scalars().all())
-
-            if not files:
-                return 0
-
-            now = datetime.now(UTC)
-            for f in files:
-                f.deleted_at = now
-                f.version += 1
-
-                if machine_id is not None:
-                    f.updated_by = machine_id
-
-                change = ChangeLog(
-                    file_id=f.id,
-                    file_path=f.path,
-                    action="DELETED",
-                    version=f.version,
-                    machine_id=actual_machine_id,
-                )
-                session.add(change)
-
-            session.commit()
-            return len(files)
+        # No exact match - try as folder prefix
+        return self.delete_folder(path, machine_id)
 
     def delete_folder(self, folder_path: str, machine_id: int | None) -> int:
         """Soft-delete all files in a folder (recursive).
@@ -549,39 +521,46 @@ class Database:
         if not folder_path.endswith("/"):
             folder_path = folder_path + "/"
 
-        deleted_count = 0
-        now = datetime.now(UTC)
+        values: dict[str, object] = {
+            "deleted_at": datetime.now(UTC),
+            "version": FileMetadata.version + 1,
+        }
+        # Update updated_by if original machine_id was provided
+        if machine_id is not None:
+            values["updated_by"] = machine_id
 
         with self._session() as session:
-            # Find all non-deleted files in the folder
-            stmt = select(FileMetadata).where(
-                FileMetadata.path.startswith(folder_path),
-                FileMetadata.deleted_at.is_(None),
+            # Trash every non-deleted file in the folder with one statement
+            stmt = (
+                update(FileMetadata)
+                .where(
+                    FileMetadata.path.startswith(folder_path),
+                    FileMetadata.deleted_at.is_(None),
+                )
+                .values(values)
+                .returning(FileMetadata.id, FileMetadata.path, FileMetadata.version)
             )
-            files = list(session.execute(stmt).scalars().all())
-
-            for file in files:
-                file.deleted_at = now
-                file.version += 1
-
-                # Update updated_by if original machine_id was provided
-                if machine_id is not None:
-                    file.updated_by = machine_id
-
-                # Log change
-                change = ChangeLog(
-                    file_id=file.id,
-                    file_path=file.path,
-                    action="DELETED",
-                    version=file.version,
-                    machine_id=actual_machine_id,
+            deleted = session.execute(stmt).all()
+
+            # Log changes in a single batched insert
+            if deleted:
+                session.execute(
+                    insert(ChangeLog),
+                    [
+                        {
+                            "file_id": file_id,
+                            "file_path": file_path,
+                            "action": "DELETED",
+                            "version": version,
+                            "machine_id": actual_machine_id,
+                        }
+                        for file_id, file_path, version in deleted
+                    ],
                 )
-                session.add(change)
-                deleted_count += 1
 
             session.commit()
 
-        return deleted_count
+        return len(deleted)
 
     def list_trash(self) -> list[FileMetadata]:
         """List deleted files.
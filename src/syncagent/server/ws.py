@@ -175,13 +175,22 @@ class StatusHub:
         # Broadcast updated status
         await self._broadcast_status(machine_id)
 
-    async def disconnect_client(self, machine_id: int) -> None:
+    async def disconnect_client(
+        self,
+        machine_id: int,
+        websocket: WebSocket | None = None,
+    ) -> None:
         """Handle client disconnection.
 
         Args:
             machine_id: ID of the machine that disconnected.
+            websocket: The connection that closed. If the machine has already
+                reconnected with a newer connection, the call is ignored.
         """
         async with self._lock:
+            current = self._client_connections.get(machine_id)
+            if websocket is not None and current is not websocket:
+                return
             self._client_connections.pop(machine_id, None)
 
             if machine_id in self._machine_status:
@@ -555,10 +564,10 @@ async def websocket_client(websocket: WebSocket, token: str) -> None:
             data = await websocket.receive_json()
             await hub.handle_client_message(machine.id, data)
     except WebSocketDisconnect:
-        await hub.disconnect_client(machine.id)
+        await hub.disconnect_client(machine.id, websocket)
     except Exception as e:
         logger.exception("Error in client WebSocket: %s", e)
-        await hub.disconnect_client(machine.id)
+        await hub.disconnect_client(machine.id, websocket)
 
 
 @router.websocket("/ws/dashboard")
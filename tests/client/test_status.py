@@ -300,3 +300,25 @@ class TestStatusReporterLifecycle:
 
             # Only one thread should be created
             reporter.stop()
+
+    def test_stop_ignores_close_timeout(self, config: ServerConfig) -> None:
+        """Should finish stopping when closing the connection times out."""
+        reporter = StatusReporter(config)
+        reporter._loop = MagicMock()
+        reporter._ws = MagicMock()
+
+        future = MagicMock()
+        future.result.side_effect = TimeoutError
+
+        def run_coroutine_threadsafe(coro: Any, _loop: Any) -> MagicMock:
+            coro.close()
+            return future
+
+        with patch(
+            "syncagent.client.status.asyncio.run_coroutine_threadsafe",
+            side_effect=run_coroutine_threadsafe,
+        ):
+            reporter.stop()
+
+        future.result.assert_called_once_with(timeout=5.0)
+        assert not reporter._should_run
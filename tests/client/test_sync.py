@@ -1,5 +1,6 @@
 """Tests for sync operations."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -19,14 +20,12 @@ from syncagent.client.sync import (
     retry_with_network_wait,
     wait_for_network,
 )
-from syncagent.core.crypto import derive_key, generate_salt
 
 
 @pytest.fixture
 def encryption_key() -> bytes:
     """Generate a test encryption key."""
-    salt = generate_salt()
-    return derive_key("test-password", salt)
+    return os.urandom(32)
 
 
 @pytest.fixture
@@ -104,6 +103,60 @@ class TestFileUploader:
         assert result.server_version == 3
         mock_client.update_file.assert_called_once()
 
+    def test_upload_unchanged_content_skips_update(
+        self,
+        tmp_path: Path,
+        mock_client: MagicMock,
+        encryption_key: bytes,
+        sync_state: LocalSyncState,
+    ) -> None:
+        """Should keep the server version when only the mtime changed."""
+        from syncagent.core.crypto import compute_file_hash
+
+        test_file = tmp_path / "touched.txt"
+        test_file.write_text("Same content")
+
+        server_file = MagicMock()
+        server_file.id = 7
+        server_file.version = 2
+        server_file.content_hash = compute_file_hash(test_file)
+        mock_client.get_file_metadata.return_value = server_file
+
+        uploader = FileUploader(mock_client, encryption_key, state=sync_state)
+        result = uploader.upload_file(test_file, "touched.txt", parent_version=2)
+
+        assert result.server_version == 2
+        mock_client.upload_chunk.assert_not_called()
+        mock_client.update_file.assert_not_called()
+        synced = sync_state.get_file("touched.txt")
+        assert synced is not None
+        assert synced.local_mtime == test_file.stat().st_mtime
+
+    def test_upload_unchanged_content_clears_upload_progress(
+        self,
+        tmp_path: Path,
+        mock_client: MagicMock,
+        encryption_key: bytes,
+    ) -> None:
+        """Should drop progress saved by an interrupted upload when skipping."""
+        from syncagent.core.crypto import compute_file_hash
+
+        test_file = tmp_path / "touched.txt"
+        test_file.write_text("Same content")
+
+        server_file = MagicMock()
+        server_file.id = 7
+        server_file.version = 2
+        server_file.content_hash = compute_file_hash(test_file)
+        mock_client.get_file_metadata.return_value = server_file
+        state = MagicMock()
+
+        uploader = FileUploader(mock_client, encryption_key, state=state)
+        uploader.upload_file(test_file, "touched.txt", parent_version=2)
+
+        state.clear_upload_progress.assert_called_once_with("touched.txt")
+        state.mark_synced.assert_called_once()
+
     def test_upload_skips_existing_chunks(
         self,
         tmp_path: Path,
@@ -601,6 +654,27 @@ class TestChangeScanner:
 
         assert "pending.txt" in result.uploaded
 
+    def test_scan_walks_nested_dirs_and_skips_symlinks(
+        self,
+        tmp_path: Path,
+        mock_client: MagicMock,
+        sync_state: LocalSyncState,
+    ) -> None:
+        """Should report nested files with "/" paths, skipping symlinks and ignored dirs."""
+        base_path = tmp_path / "sync"
+        (base_path / "a" / "b").mkdir(parents=True)
+        (base_path / "a" / "b" / "deep.txt").write_text("Deep")
+        (base_path / "top.txt").write_text("Top")
+        (base_path / ".git").mkdir()
+        (base_path / ".git" / "HEAD").write_text("ref")
+        (base_path / "link.txt").symlink_to(base_path / "top.txt")
+        (base_path / "loop").symlink_to(base_path)
+
+        scanner = ChangeScanner(mock_client, sync_state, base_path)
+        local = scanner.scan_local_changes()
+
+        assert sorted(f.path for f in local.created) == ["a/b/deep.txt", "top.txt"]
+
     def test_scan_respects_syncignore(
         self,
         tmp_path: Path,
@@ -111,6 +111,14 @@ class TestIgnorePatterns:
 
         assert ignore.should_ignore(syncagent_dir, tmp_path) is True
 
+    def test_matches_without_filesystem(self) -> None:
+        """matches() should decide from the relative path and entry type alone."""
+        ignore = IgnorePatterns(["build/"])
+        assert ignore.matches("build", is_dir=True) is True
+        assert ignore.matches("docs/build", is_dir=False) is False
+        assert ignore.matches("docs/notes.tmp", is_dir=False) is True
+        assert ignore.matches("docs/notes.txt", is_dir=False) is False
+
 
 class TestFileChange:
     """Tests for FileChange dataclass."""
@@ -1,5 +1,6 @@
 """Tests for worker classes."""
 
+import os
 import threading
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -239,9 +240,7 @@ class TestUploadWorker:
     @pytest.fixture
     def encryption_key(self) -> bytes:
         """Generate test encryption key."""
-        from syncagent.core.crypto import derive_key, generate_salt
-
-        return derive_key("test", generate_salt())
+        return os.urandom(32)
 
     def test_worker_type(
         self,
@@ -297,9 +296,7 @@ class TestDownloadWorker:
     @pytest.fixture
     def encryption_key(self) -> bytes:
         """Generate test encryption key."""
-        from syncagent.core.crypto import derive_key, generate_salt
-
-        return derive_key("test", generate_salt())
+        return os.urandom(32)
 
     def test_worker_type(
         self,
@@ -396,6 +393,28 @@ class TestDeleteWorker:
         assert result is True
         assert not test_file.exists()
 
+    def test_delete_remote_prunes_empty_parents(
+        self, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should remove directories left empty, up to the first non-empty one."""
+        nested = tmp_path / "docs" / "sub" / "deep"
+        nested.mkdir(parents=True)
+        (nested / "gone.txt").write_text("content")
+        (tmp_path / "docs" / "keep.txt").write_text("unsynced")
+
+        event = SyncEvent.create(
+            event_type=SyncEventType.REMOTE_DELETED,
+            path="docs/sub/deep/gone.txt",
+            source=SyncEventSource.REMOTE,
+        )
+
+        worker = DeleteWorker(mock_client, tmp_path)
+        assert worker.execute(event) is True
+
+        assert not (tmp_path / "docs" / "sub").exists()
+        assert (tmp_path / "docs" / "keep.txt").exists()
+        assert tmp_path.exists()
+
 
 class TestWorkerPool:
     """Tests for WorkerPool."""
@@ -408,9 +427,7 @@ class TestWorkerPool:
     @pytest.fixture
     def encryption_key(self) -> bytes:
         """Generate test encryption key."""
-        from syncagent.core.crypto import derive_key, generate_salt
-
-        return derive_key("test", generate_salt())
+        return os.urandom(32)
 
     def test_initial_state(
         self,
@@ -558,9 +575,7 @@ class TestUploadWorkerEarlyConflict:
     @pytest.fixture
     def encryption_key(self) -> bytes:
         """Generate test encryption key."""
-        from syncagent.core.crypto import derive_key, generate_salt
-
-        return derive_key("test", generate_salt())
+        return os.urandom(32)
 
     def test_pre_upload_conflict_resolution(
         self,
@@ -0,0 +1,39 @@
+"""Fast stand-in for the keystore's Argon2id key derivation.
+
+Tests patch syncagent.client.keystore.derive_key with fast_derive_key so
+that creating and unlocking keystores costs one HMAC instead of an Argon2id
+run. Argon2id itself is covered by tests/test_crypto.py. A wrong password
+still derives a different key and fails to decrypt the stored key.
+
+Results are memoized per (password, salt), since the suites unlock the same
+keyfiles many times. The keystore itself never caches derived keys.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import hmac
+
+import pytest
+
+# Attribute patched by patch_derive_key()
+DERIVE_KEY_TARGET = "syncagent.client.keystore.derive_key"
+
+
+@functools.lru_cache(maxsize=64)
+def fast_derive_key(password: str, salt: bytes) -> bytes:
+    """HMAC-SHA256(salt, password): same signature and key size as derive_key()."""
+    return hmac.new(salt, password.encode("utf-8"), hashlib.sha256).digest()
+
+
+def patch_derive_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the keystore use fast_derive_key() instead of Argon2id."""
+    monkeypatch.setattr(DERIVE_KEY_TARGET, fast_derive_key)
+
+
+def install() -> None:
+    """Patch the keystore for the rest of the process (used by subprocesses)."""
+    import syncagent.client.keystore
+
+    syncagent.client.keystore.derive_key = fast_derive_key
@@ -8,11 +8,29 @@ from __future__ import annotations
 # Re-export local CLI fixtures
 from tests.integration.cli.fixtures import (
     PatchedCLI,
+    assert_file,
+    build_tree,
+    bulk_unlink,
+    bulk_write,
+    bump_mtime,
+    cli_env,
     cli_runner,
+    client_dirs,
+    client_template,
+    clone_client,
+    config_root,
     init_client,
-    patch_config_dir,
+    keystore_test_mode,
+    large_payload,
+    make_client,
+    paired_clients,
     register_client,
+    registered_client,
+    save_registration,
+    share_key,
+    sync_all,
     sync_client,
+    template_key,
     test_config_dir,
     test_sync_folder,
 )
@@ -23,23 +41,43 @@ from tests.integration.conftest import (
     client_b,
     client_factory,
     encryption_key,
+    shared_server,
     test_server,
 )
 
 __all__ = [
     # Server fixtures
+    "shared_server",
     "test_server",
     "encryption_key",
     "client_factory",
     "client_a",
     "client_b",
     # CLI fixtures
+    "cli_env",
     "cli_runner",
+    "client_dirs",
+    "client_template",
+    "clone_client",
+    "config_root",
     "test_config_dir",
     "test_sync_folder",
-    "patch_config_dir",
     "PatchedCLI",
+    "assert_file",
+    "build_tree",
+    "bulk_unlink",
+    "bulk_write",
+    "bump_mtime",
+    "keystore_test_mode",
+    "large_payload",
     "init_client",
+    "make_client",
     "register_client",
+    "paired_clients",
+    "registered_client",
+    "save_registration",
+    "share_key",
+    "sync_all",
     "sync_client",
+    "template_key",
 ]
@@ -1,21 +1,66 @@
 """Common fixtures and helpers for CLI tests.
 
-These fixtures provide isolated test environments for CLI commands
-by patching get_config_dir in all relevant modules.
+These fixtures provide isolated test environments for CLI commands by
+pointing the CLI at a per-test config directory through the
+SYNCAGENT_CONFIG_DIR environment variable (see PatchedCLI and cli_env).
 """
 
 from __future__ import annotations
 
+import json
+import os
+import random
+import shutil
+import tempfile
+from collections.abc import Callable, Generator
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
+from syncagent.client.cli import cli
+from syncagent.client.cli.config import CONFIG_DIR_ENV
+from syncagent.client.cli.keystore import initialize
+from syncagent.client.cli.sync import run_sync
+from syncagent.client.keystore import KeyStore, load_keystore
+from syncagent.client.sync import SyncResult
+from syncagent.core.chunking import MIN_CHUNK_SIZE, chunk_bytes
+from tests.fast_kdf import patch_derive_key
+from tests.integration.conftest import TestServer
 
-@pytest.fixture
+# Returns (config_dir, sync_folder) for a client name
+ClientDirs = Callable[[str], tuple[Path, Path]]
+
+# Returns (config_dir, sync_folder) of a new registered client (see make_client)
+MakeClient = Callable[[str], tuple[Path, Path]]
+
+# Points the CLI at a config directory (see cli_env)
+CliEnv = Callable[[Path], None]
+
+# ((config_a, sync_a), (config_b, sync_b)) from the paired_clients fixture
+PairedClients = tuple[tuple[Path, Path], tuple[Path, Path]]
+
+# Unlocked keystores by config directory, reused by sync_client_fast()
+_keystores: dict[Path, KeyStore] = {}
+
+# Keys printed by 'export-key' by config directory, reused by share_key()
+_exported_keys: dict[Path, str] = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def keystore_test_mode() -> Generator[None]:
+    """Derive keystore keys with HMAC-SHA256 instead of Argon2 (see tests.fast_kdf).
+
+    Argon2 itself is covered by tests/test_crypto.py.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        patch_derive_key(mp)
+        yield
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Create a CliRunner for testing."""
+    """CliRunner shared by all tests; invoke() keeps no state between calls."""
     return CliRunner()
 
 
@@ -35,66 +80,201 @@ def test_sync_folder(tmp_path: Path) -> Path:
     return sync_folder
 
 
-def patch_config_dir(config_dir: Path) -> list:
-    """Create patches for get_config_dir in all CLI modules.
+@pytest.fixture(scope="session")
+def config_root(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path]:
+    """Session directory for client config dirs, on tmpfs when available.
+
+    Config dirs hold the keyfile, config.json and the SQLite state database;
+    keeping them in RAM (/dev/shm) avoids disk syncs for data the tests
+    never inspect. Sync folders stay on the regular tmp_path.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix="syncagent-pytest-", dir=shm))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("config")
+
+
+@pytest.fixture
+def client_dirs(config_root: Path, tmp_path: Path) -> Generator[ClientDirs]:
+    """Factory returning (config_dir, sync_folder) for a named client.
+
+    The config dir lives under config_root, the sync folder under tmp_path.
+    """
+    config_base = Path(tempfile.mkdtemp(dir=config_root))
+
+    def _client_dirs(name: str) -> tuple[Path, Path]:
+        return config_base / name / ".syncagent", tmp_path / name / "sync"
+
+    yield _client_dirs
+    shutil.rmtree(config_base, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def client_template(config_root: Path) -> Path:
+    """Create an initialized config directory once per session.
+
+    Running 'init' derives the master key with Argon2, which dominates the
+    cost of client setup. Tests clone this template with clone_client()
+    instead of running 'init' themselves. All clones share the same
+    encryption key, like clients that imported each other's key.
+    """
+    base = config_root / "client-template"
+    config_dir = base / ".syncagent"
+    init_client(config_dir, base / "sync")
+    return config_dir
+
+
+@pytest.fixture(scope="session")
+def template_key(client_template: Path) -> bytes:
+    """Encryption key shared by every client cloned from client_template."""
+    return load_keystore("testpassword", client_template).encryption_key
+
+
+@pytest.fixture(scope="session")
+def large_payload() -> bytes:
+    """A payload just large enough to span two chunks.
+
+    Seeded random data: FastCDC never cuts constant data below MAX_CHUNK_SIZE.
+    """
+    payload = random.Random(0).randbytes(2 * MIN_CHUNK_SIZE + 1)
+    assert len(list(chunk_bytes(payload))) > 1
+    return payload
+
+
+@pytest.fixture
+def make_client(
+    client_template: Path,
+    client_dirs: ClientDirs,
+    test_server: TestServer,
+) -> MakeClient:
+    """Factory creating named clients registered with test_server.
+
+    Each client is cloned from client_template, so all clients of a test
+    share one encryption key without an export/import-key round-trip. The
+    machine is inserted directly in the server database: no invitation and
+    no 'register' round-trip (covered by test_register.py).
+    """
+
+    def _make_client(name: str) -> tuple[Path, Path]:
+        config_dir, sync_folder = client_dirs(name)
+        clone_client(client_template, config_dir, sync_folder)
+        token = test_server.register_machine(name)
+        save_registration(config_dir, test_server.url, token, name)
+        return config_dir, sync_folder
+
+    return _make_client
+
+
+@pytest.fixture
+def registered_client(make_client: MakeClient) -> tuple[Path, Path]:
+    """A single registered client named 'test-client' (see make_client).
 
-    Must be used with start/stop pattern:
-        patches = patch_config_dir(config_dir)
-        for p in patches:
-            p.start()
-        try:
-            # ... test code ...
-        finally:
-            for p in patches:
-                p.stop()
+    Returns:
+        (config_dir, sync_folder)
     """
-    return [
-        patch("syncagent.client.cli.keystore.get_config_dir", return_value=config_dir),
-        patch("syncagent.client.cli.register.get_config_dir", return_value=config_dir),
-        patch("syncagent.client.cli.sync.get_config_dir", return_value=config_dir),
-        patch("syncagent.client.cli.config.get_config_dir", return_value=config_dir),
-    ]
+    return make_client("test-client")
+
+
+@pytest.fixture
+def paired_clients(make_client: MakeClient) -> PairedClients:
+    """Two clients, 'client-a' and 'client-b', sharing one encryption key.
+
+    Returns:
+        ((config_a, sync_a), (config_b, sync_b))
+    """
+    return make_client("client-a"), make_client("client-b")
+
+
+def clone_client(template: Path, config_dir: Path, sync_folder: Path) -> None:
+    """Copy an initialized config directory and point it at a sync folder.
+
+    Args:
+        template: Config directory created by the client_template fixture
+        config_dir: Destination config directory
+        sync_folder: Sync folder to store in the cloned config
+    """
+    shutil.copytree(template, config_dir, dirs_exist_ok=True)
+    sync_folder.mkdir(parents=True, exist_ok=True)
+
+    config_file = config_dir / "config.json"
+    config = json.loads(config_file.read_text())
+    config["sync_folder"] = str(sync_folder.resolve())
+    config_file.write_text(json.dumps(config, indent=2))
+
+
+def save_registration(
+    config_dir: Path,
+    server_url: str,
+    auth_token: str,
+    machine_name: str,
+) -> None:
+    """Write registration settings as 'register' would, without the CLI.
+
+    Args:
+        config_dir: Path to config directory
+        server_url: Server URL
+        auth_token: Machine token (see TestServer.register_machine)
+        machine_name: Name of the registered machine
+    """
+    config_file = config_dir / "config.json"
+    config = json.loads(config_file.read_text()) if config_file.exists() else {}
+    config["server_url"] = server_url
+    config["auth_token"] = auth_token
+    config["machine_name"] = machine_name
+    config_file.write_text(json.dumps(config, indent=2))
 
 
 class PatchedCLI:
-    """Context manager for CLI tests with patched config directory."""
+    """Context manager pointing the CLI at a config directory.
+
+    Sets SYNCAGENT_CONFIG_DIR for the duration of the block. Tests that use
+    a single config directory at a time can use the cli_env fixture instead.
+    """
 
     def __init__(self, config_dir: Path):
         self.config_dir = config_dir
-        self.patches = patch_config_dir(config_dir)
+        self._monkeypatch = pytest.MonkeyPatch()
 
     def __enter__(self):
-        for p in self.patches:
-            p.start()
+        self._monkeypatch.setenv(CONFIG_DIR_ENV, str(self.config_dir))
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        for p in self.patches:
-            p.stop()
+        self._monkeypatch.undo()
         return False
 
 
+@pytest.fixture
+def cli_env(monkeypatch: pytest.MonkeyPatch) -> CliEnv:
+    """Point the CLI at a config directory until the end of the test.
+
+    Call it again to switch to another client's config directory.
+    """
+
+    def _use_config_dir(config_dir: Path) -> None:
+        monkeypatch.setenv(CONFIG_DIR_ENV, str(config_dir))
+
+    return _use_config_dir
+
+
 def init_client(
-    cli_runner: CliRunner,
     config_dir: Path,
     sync_folder: Path,
     password: str = "testpassword",
 ) -> None:
-    """Initialize a client with the given password and sync folder.
+    """Initialize a client as 'init' would, without going through Click.
+
+    The 'init' prompts and output are covered by test_init.py.
 
     Args:
-        cli_runner: Click test runner
         config_dir: Path to config directory
         sync_folder: Path to sync folder
         password: Master password (default: "testpassword")
     """
-    from syncagent.client.cli import cli
-
-    with PatchedCLI(config_dir):
-        input_text = f"{password}\n{password}\n{sync_folder}\n"
-        result = cli_runner.invoke(cli, ["init"], input=input_text)
-        if result.exit_code != 0:
-            raise RuntimeError(f"init failed: {result.output}")
+    initialize(config_dir, password, sync_folder.resolve())
 
 
 def register_client(
@@ -113,8 +293,6 @@ def register_client(
         invitation_token: Invitation token from server
         machine_name: Name for this machine
     """
-    from syncagent.client.cli import cli
-
     with PatchedCLI(config_dir):
         result = cli_runner.invoke(
             cli,
@@ -139,10 +317,194 @@ def sync_client(
     Returns:
         CLI output
     """
-    from syncagent.client.cli import cli
-
     with PatchedCLI(config_dir):
         result = cli_runner.invoke(cli, ["sync"], input=f"{password}\n")
         if result.exit_code != 0:
             raise RuntimeError(f"sync failed: {result.output}\n{result.exception}")
         return result.output
+
+
+def sync_client_fast(config_dir: Path, password: str = "testpassword") -> SyncResult:
+    """Run a sync in-process, without going through Click.
+
+    The keystore is unlocked (Argon2) once per config directory and cached,
+    so repeated syncs of the same client only pay for the sync itself.
+    Call forget_keystore() after changing the client's key.
+
+    Args:
+        config_dir: Path to config directory
+        password: Master password
+
+    Returns:
+        SyncResult of the sync
+    """
+    keystore = _keystores.get(config_dir)
+    if keystore is None:
+        keystore = load_keystore(password, config_dir)
+        _keystores[config_dir] = keystore
+    return run_sync(config_dir, keystore.encryption_key, no_progress=True)
+
+
+def forget_keystore(config_dir: Path) -> None:
+    """Drop the cached keystore of a client (e.g. after import-key)."""
+    _keystores.pop(config_dir, None)
+    _exported_keys.pop(config_dir, None)
+
+
+def share_key(
+    cli_runner: CliRunner,
+    source: Path,
+    target: Path,
+    password: str = "testpassword",
+) -> None:
+    """Give target the encryption key of source via export-key/import-key.
+
+    The exported key is cached per source, so sharing one client's key
+    with several others unlocks the source only once.
+
+    Args:
+        cli_runner: Click test runner
+        source: Config directory to export the key from
+        target: Config directory to import the key into
+        password: Master password of both clients
+    """
+    key = _exported_keys.get(source)
+    if key is None:
+        with PatchedCLI(source):
+            result = cli_runner.invoke(cli, ["export-key", "--json"], input=f"{password}\n")
+            if result.exit_code != 0:
+                raise RuntimeError(f"export-key failed: {result.output}")
+        key = _exported_keys[source] = json.loads(result.stdout)["key"]
+
+    with PatchedCLI(target):
+        result = cli_runner.invoke(cli, ["import-key", key], input=f"{password}\n")
+        if result.exit_code != 0:
+            raise RuntimeError(f"import-key failed: {result.output}")
+    forget_keystore(target)
+
+
+def bump_mtime(path: Path, delta: float = 2.0) -> None:
+    """Move a file's mtime forward instead of sleeping before a write.
+
+    Change detection compares mtime with the last synced mtime. Bumping it
+    explicitly is deterministic, even on filesystems with coarse timestamps.
+
+    Args:
+        path: File to touch
+        delta: Seconds to add to the current mtime
+    """
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + delta))
+
+
+def assert_file(path: Path, content: str | None) -> None:
+    """Assert a synced file's content, or that it is absent when content is None.
+
+    Reading the bytes directly covers the existence check too, so a
+    positive assertion is one open+read instead of a stat followed by it.
+    """
+    if content is None:
+        assert not path.exists(), f"{path} should not exist"
+        return
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        raise AssertionError(f"{path} does not exist") from None
+    assert data == content.encode(), f"{path}: {data!r} != {content!r}"
+
+
+def _open_dir(directory: Path) -> int | None:
+    """Open a directory fd for *at() calls, or None if unsupported (Windows)."""
+    if os.open not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+        return None
+    return os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+
+
+def bulk_write(directory: Path, files: dict[str, str | bytes]) -> None:
+    """Create several files in one directory.
+
+    Names are resolved relative to a single directory fd, so the parent
+    path is walked once instead of once per file.
+
+    Args:
+        directory: Existing directory to write into
+        files: Mapping of file name to content (str is UTF-8 encoded)
+    """
+    dir_fd = _open_dir(directory)
+    try:
+        for name, content in files.items():
+            data = content.encode() if isinstance(content, str) else content
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            target = directory / name if dir_fd is None else name
+            fd = os.open(target, flags, 0o644, dir_fd=dir_fd)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def bulk_unlink(directory: Path, names: list[str]) -> None:
+    """Delete several files from one directory (see bulk_write).
+
+    Args:
+        directory: Directory containing the files
+        names: File names to delete
+    """
+    dir_fd = _open_dir(directory)
+    try:
+        for name in names:
+            os.unlink(directory / name if dir_fd is None else name, dir_fd=dir_fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+Tree = dict[str, "str | bytes | Tree"]
+
+
+def build_tree(root: Path, spec: Tree) -> None:
+    """Create a directory tree in one depth-first pass.
+
+    Each directory is created once, parents before children, instead of
+    mkdir(parents=True) per file.
+
+    Args:
+        root: Directory to build into (created if missing)
+        spec: Mapping of name to file content (str/bytes) or sub-tree (dict)
+
+    Example:
+        build_tree(sync_folder, {"docs": {"a.txt": "A", "sub": {"b.txt": "B"}}})
+    """
+    stack: list[tuple[Path, Tree]] = [(root, spec)]
+    while stack:
+        directory, entries = stack.pop()
+        directory.mkdir(exist_ok=True)
+        for name, entry in entries.items():
+            path = directory / name
+            if isinstance(entry, dict):
+                stack.append((path, entry))
+            elif isinstance(entry, str):
+                path.write_text(entry, encoding="utf-8")
+            else:
+                path.write_bytes(entry)
+
+
+def sync_all(config_dirs: list[Path]) -> list[SyncResult]:
+    """Sync several clients one after another (see sync_client_fast).
+
+    The syncs run sequentially on purpose: run_sync saves and restores the
+    process-wide "syncagent" logger, so overlapping syncs would clobber each
+    other's logging state.
+
+    Args:
+        config_dirs: Config directories of the clients to sync
+
+    Returns:
+        Sync results, in the order of config_dirs.
+    """
+    return [sync_client_fast(config_dir) for config_dir in config_dirs]
@@ -27,42 +27,17 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
+from tests.integration.cli.fixtures import (
+    ClientDirs,
+    MakeClient,
+    PairedClients,
+    PatchedCLI,
+    init_client,
+    save_registration,
+)
 from tests.integration.conftest import TestServer
 
 
-def setup_client_with_key(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str,
-    import_key_from: Path | None = None,
-) -> tuple[Path, Path]:
-    """Setup a client, optionally importing key from another client."""
-    config_dir = tmp_path / name / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / name / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
-
-    init_client(cli_runner, config_dir, sync_folder)
-
-    if import_key_from:
-        # Export key from source
-        with PatchedCLI(import_key_from):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-
-        # Import to this client
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
-
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
-
-    return config_dir, sync_folder
-
-
 def do_sync(cli_runner: CliRunner, config_dir: Path, password: str = "testpassword") -> str:
     """Run sync and return output."""
     with PatchedCLI(config_dir):
@@ -78,14 +53,13 @@ class TestFourPlusClients:
     def test_four_clients_sync(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        make_client: MakeClient,
     ) -> None:
         """Four clients should all sync successfully."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
-        config_c, sync_c = setup_client_with_key(cli_runner, tmp_path, test_server, "client-c", import_key_from=config_a)
-        config_d, sync_d = setup_client_with_key(cli_runner, tmp_path, test_server, "client-d", import_key_from=config_a)
+        config_a, sync_a = make_client("client-a")
+        config_b, sync_b = make_client("client-b")
+        config_c, sync_c = make_client("client-c")
+        config_d, sync_d = make_client("client-d")
 
         # A creates file
         (sync_a / "shared.txt").write_text("From A")
@@ -105,15 +79,14 @@ class TestFourPlusClients:
     def test_file_propagates_through_all_clients(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        make_client: MakeClient,
     ) -> None:
         """File created by first client should reach all others."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
-        config_c, sync_c = setup_client_with_key(cli_runner, tmp_path, test_server, "client-c", import_key_from=config_a)
-        config_d, sync_d = setup_client_with_key(cli_runner, tmp_path, test_server, "client-d", import_key_from=config_a)
-        config_e, sync_e = setup_client_with_key(cli_runner, tmp_path, test_server, "client-e", import_key_from=config_a)
+        config_a, sync_a = make_client("client-a")
+        config_b, sync_b = make_client("client-b")
+        config_c, sync_c = make_client("client-c")
+        config_d, sync_d = make_client("client-d")
+        config_e, sync_e = make_client("client-e")
 
         # A creates multiple files
         (sync_a / "file1.txt").write_text("File 1")
@@ -139,14 +112,18 @@ class TestEncryptionKeyScenarios:
     def test_wrong_key_cannot_decrypt(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
+        client_dirs: ClientDirs,
         test_server: TestServer,
     ) -> None:
         """Client with different key should fail to decrypt files."""
-        # A has its own key
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        # B has different key (no import)
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b")
+        # A has the template key
+        config_a, sync_a = make_client("client-a")
+        # B has a different key: initialized on its own, not cloned
+        config_b, sync_b = client_dirs("client-b")
+        init_client(config_b, sync_b)
+        token = test_server.register_machine("client-b")
+        save_registration(config_b, test_server.url, token, "client-b")
 
         # A uploads
         (sync_a / "secret.txt").write_text("Encrypted by A")
@@ -168,12 +145,10 @@ class TestEncryptionKeyScenarios:
     def test_same_key_clients_sync(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Clients with same key can sync files."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A uploads
         (sync_a / "shared.txt").write_text("Can be decrypted")
@@ -192,13 +167,12 @@ class TestConcurrentModifications:
     def test_three_clients_different_files(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        make_client: MakeClient,
     ) -> None:
         """Three clients modifying different files should all sync."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
-        config_c, sync_c = setup_client_with_key(cli_runner, tmp_path, test_server, "client-c", import_key_from=config_a)
+        config_a, sync_a = make_client("client-a")
+        config_b, sync_b = make_client("client-b")
+        config_c, sync_c = make_client("client-c")
 
         # All create different files
         (sync_a / "from_a.txt").write_text("A's file")
@@ -224,12 +198,10 @@ class TestConcurrentModifications:
     def test_rapid_sequential_syncs(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Rapid back-to-back syncs should work correctly."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file and syncs multiple times rapidly
         (sync_a / "rapid.txt").write_text("v1")
@@ -252,12 +224,10 @@ class TestConcurrentModifications:
     def test_interleaved_syncs(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Interleaved syncs between clients should work."""
-        config_a, sync_a = setup_client_with_key(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client_with_key(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates
         (sync_a / "interleaved.txt").write_text("A's version 1")
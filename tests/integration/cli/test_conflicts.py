@@ -29,31 +29,7 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import (
-    PatchedCLI,
-    init_client,
-    register_client,
-)
-from tests.integration.conftest import TestServer
-
-
-def setup_client(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str,
-) -> tuple[Path, Path]:
-    """Setup a client with init and register."""
-    config_dir = tmp_path / name / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / name / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
-
-    init_client(cli_runner, config_dir, sync_folder)
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
-
-    return config_dir, sync_folder
+from tests.integration.cli.fixtures import PairedClients, PatchedCLI
 
 
 def do_sync(cli_runner: CliRunner, config_dir: Path, password: str = "testpassword") -> str:
@@ -69,12 +45,10 @@ class TestConflictDetection:
     def test_both_modify_same_file(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """When both clients modify the same file, a conflict should be detected."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file
         (sync_a / "shared.txt").write_text("Initial content")
@@ -108,12 +82,10 @@ class TestConflictDetection:
     def test_modify_vs_delete_conflict(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Conflict when one modifies and other deletes."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file
         (sync_a / "conflict.txt").write_text("Initial")
@@ -140,12 +112,10 @@ class TestConflictDetection:
     def test_conflict_creates_conflict_file(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Conflict should create a .conflict-<timestamp> file."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup: both have same file
         (sync_a / "doc.txt").write_text("Initial")
@@ -170,12 +140,10 @@ class TestConflictDetection:
     def test_conflict_shown_in_summary(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Conflicts should be mentioned in sync summary."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup conflict scenario
         (sync_a / "test.txt").write_text("Initial")
@@ -199,12 +167,10 @@ class TestConflictResolution:
     def test_local_file_preserved_after_conflict(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Local file content should be preserved in some form after conflict."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup
         (sync_a / "preserve.txt").write_text("Initial")
@@ -232,12 +198,10 @@ class TestConflictResolution:
     def test_manual_conflict_resolution(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """User can resolve conflict by removing conflict file."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup conflict
         (sync_a / "resolve.txt").write_text("Initial")
@@ -271,12 +235,10 @@ class TestConflictEdgeCases:
     def test_conflict_in_subdirectory(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Conflicts should work for files in subdirectories."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup file in subdir
         (sync_a / "docs").mkdir()
@@ -298,12 +260,10 @@ class TestConflictEdgeCases:
     def test_consecutive_conflicts_same_file(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Multiple conflicts on same file should all be handled."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b")
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Setup
         (sync_a / "multi.txt").write_text("v0")
@@ -36,50 +36,63 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-
-from click.testing import CliRunner
-
-from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
+from unittest import mock
+
+import pytest
+
+from syncagent.client.sync import SyncResult
+from tests.integration.cli.fixtures import (
+    ClientDirs,
+    MakeClient,
+    PairedClients,
+    assert_file,
+    build_tree,
+    bulk_unlink,
+    bulk_write,
+    bump_mtime,
+    sync_all,
+    sync_client_fast,
+)
 from tests.integration.conftest import TestServer
 
+# Payloads written by several tests below. Their chunks are pre-seeded on
+# the server so uploads hit the chunk_exists() short-circuit.
+COMMON_PAYLOADS = [
+    "Delete me",
+    "File 1",
+    "File 2",
+    "Shared content",
+    "Original",
+    "Version 1",
+    "Version 2",
+]
 
-def setup_client(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str,
-    import_key_from: Path | None = None,
-) -> tuple[Path, Path]:
-    """Setup a client for testing."""
-    config_dir = tmp_path / name / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / name / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
 
-    init_client(cli_runner, config_dir, sync_folder)
+@pytest.fixture(autouse=True)
+def seed_common_payloads(test_server: TestServer, template_key: bytes) -> None:
+    """Pre-seed the server with the chunks of COMMON_PAYLOADS."""
+    test_server.seed_chunks((p.encode() for p in COMMON_PAYLOADS), template_key)
 
-    if import_key_from:
-        with PatchedCLI(import_key_from):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
 
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
+def roundtrip(config_a: Path, config_b: Path, expect: Path | None = None) -> SyncResult:
+    """Push A's changes, then pull them on B.
 
-    return config_dir, sync_folder
+    The syncs run one after the other: B must not fetch before A's upload
+    is committed.
 
+    Args:
+        config_a: Config dir of the client that made the change
+        config_b: Config dir of the client that receives it
+        expect: Optional path that must exist on B afterwards
 
-def do_sync(cli_runner: CliRunner, config_dir: Path) -> str:
-    """Run sync and return output."""
-    with PatchedCLI(config_dir):
-        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-        if result.exit_code != 0:
-            raise RuntimeError(f"sync failed: {result.output}")
-        return result.output
+    Returns:
+        B's sync result.
+    """
+    sync_client_fast(config_a)
+    result = sync_client_fast(config_b)
+    if expect is not None:
+        assert expect.exists(), f"{expect} was not synced"
+    return result
 
 
 class TestBasicDeletions:
@@ -87,24 +100,24 @@ class TestBasicDeletions:
 
     def test_delete_file_syncs(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        paired_clients: PairedClients,
         test_server: TestServer,
     ) -> None:
         """Deleted file should be removed on other client."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
-        # Create and sync
+        # Create and sync (payload is pre-seeded, so no chunk is stored)
         (sync_a / "to_delete.txt").write_text("Delete me")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
-        assert (sync_b / "to_delete.txt").exists()
+        put = mock.patch.object(test_server.storage, "put", wraps=test_server.storage.put)
+        with put as storage_put:
+            sync_client_fast(config_a)
+        storage_put.assert_not_called()
+        sync_client_fast(config_b)
+        assert_file(sync_b / "to_delete.txt", "Delete me")
 
         # Delete and sync
         (sync_a / "to_delete.txt").unlink()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Should be deleted on B (or moved to trash)
         # Note: exact behavior depends on delete handling implementation
@@ -112,51 +125,37 @@ class TestBasicDeletions:
 
     def test_delete_directory_with_files(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Deleted directory should sync to other client."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Create directory with files
-        (sync_a / "mydir").mkdir()
-        (sync_a / "mydir" / "file1.txt").write_text("File 1")
-        (sync_a / "mydir" / "file2.txt").write_text("File 2")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
-        assert (sync_b / "mydir").exists()
+        build_tree(sync_a, {"mydir": {"file1.txt": "File 1", "file2.txt": "File 2"}})
+        roundtrip(config_a, config_b, expect=sync_b / "mydir")
 
         # Delete directory files
         (sync_a / "mydir" / "file1.txt").unlink()
         (sync_a / "mydir" / "file2.txt").unlink()
         (sync_a / "mydir").rmdir()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Should sync without crashing
 
     def test_delete_nested_file(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Deleted nested file should sync correctly."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Create nested structure
-        (sync_a / "level1" / "level2" / "level3").mkdir(parents=True)
-        (sync_a / "level1" / "level2" / "level3" / "deep.txt").write_text("Deep file")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        build_tree(sync_a, {"level1": {"level2": {"level3": {"deep.txt": "Deep file"}}}})
+        roundtrip(config_a, config_b)
 
         # Delete just the file
         (sync_a / "level1" / "level2" / "level3" / "deep.txt").unlink()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Directory structure may remain, file should be gone
 
@@ -166,28 +165,24 @@ class TestDeleteAndRecreate:
 
     def test_delete_and_recreate_same_file(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Delete then recreate same filename should work."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Create v1
         (sync_a / "recreate.txt").write_text("Version 1")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
-        assert (sync_b / "recreate.txt").read_text() == "Version 1"
+        roundtrip(config_a, config_b)
+        assert_file(sync_b / "recreate.txt", "Version 1")
 
         # Delete and recreate with new content
         (sync_a / "recreate.txt").unlink()
-        time.sleep(0.1)
         (sync_a / "recreate.txt").write_text("Version 2")
-        do_sync(cli_runner, config_a)
+        bump_mtime(sync_a / "recreate.txt")
+        sync_client_fast(config_a)
 
         # B syncs to get update
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have the file (either v1 or v2 depending on timing, but should exist)
         assert (sync_b / "recreate.txt").exists()
@@ -197,27 +192,23 @@ class TestDeleteAndRecreate:
 
     def test_delete_while_other_has_modifications(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Delete on A while B has local modifications."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Both have file
         (sync_a / "conflict_delete.txt").write_text("Original")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # A deletes
         (sync_a / "conflict_delete.txt").unlink()
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B modifies (before knowing about delete)
-        time.sleep(0.1)
         (sync_b / "conflict_delete.txt").write_text("B's modifications")
-        do_sync(cli_runner, config_b)
+        bump_mtime(sync_b / "conflict_delete.txt")
+        sync_client_fast(config_b)
 
         # Should handle gracefully (conflict or B's version wins)
 
@@ -227,78 +218,65 @@ class TestSimultaneousDeletions:
 
     def test_both_delete_same_file(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Both clients delete same file should work."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Both have file
         (sync_a / "both_delete.txt").write_text("Delete me")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Both delete locally
         (sync_a / "both_delete.txt").unlink()
         (sync_b / "both_delete.txt").unlink()
 
         # Both sync
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Should handle gracefully
 
     def test_multiple_files_deleted(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Deleting multiple files should sync correctly."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
+
+        files = {f"file{i}.txt": f"Content {i}" for i in range(5)}
 
         # Create multiple files
-        for i in range(5):
-            (sync_a / f"file{i}.txt").write_text(f"Content {i}")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        bulk_write(sync_a, files)
+        roundtrip(config_a, config_b)
+        assert sorted(p.name for p in sync_b.iterdir()) == sorted(files)
 
         # Delete all
-        for i in range(5):
-            (sync_a / f"file{i}.txt").unlink()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        bulk_unlink(sync_a, list(files))
+        result = roundtrip(config_a, config_b)
 
         # Should handle all deletions
+        assert len(result.deleted) == len(files)
+        assert not any((sync_b / name).exists() for name in files)
 
     def test_delete_empty_directory(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Deleting empty directory should work."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Create directory with file, sync, then delete file
         (sync_a / "emptydir").mkdir()
         (sync_a / "emptydir" / "temp.txt").write_text("temp")
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Delete file, leaving empty dir
         (sync_a / "emptydir" / "temp.txt").unlink()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Now delete empty dir
         (sync_a / "emptydir").rmdir()
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        roundtrip(config_a, config_b)
 
         # Should handle gracefully
 
@@ -308,91 +286,91 @@ class TestAdminDeletions:
 
     def test_admin_deletes_file_syncs_to_client(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Admin deletes file via server → client syncs and removes local file."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Client uploads a file
         (sync_a / "admin_delete_me.txt").write_text("Delete via admin")
-        do_sync(cli_runner, config_a)
-        assert (sync_a / "admin_delete_me.txt").exists()
+        sync_client_fast(config_a)
+        assert_file(sync_a / "admin_delete_me.txt", "Delete via admin")
 
         # Admin deletes via server (simulate WUI deletion)
         test_server.db.delete_file("admin_delete_me.txt", machine_id=None)
 
         # Client syncs again
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # File should be removed locally
-        assert not (sync_a / "admin_delete_me.txt").exists()
+        assert_file(sync_a / "admin_delete_me.txt", None)
 
     def test_admin_deletes_folder_syncs_to_client(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Admin deletes folder via server → client syncs and removes all local files."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Client uploads multiple files in a folder
-        (sync_a / "admin_folder").mkdir()
-        (sync_a / "admin_folder" / "file1.txt").write_text("File 1")
-        (sync_a / "admin_folder" / "file2.txt").write_text("File 2")
-        (sync_a / "admin_folder" / "sub").mkdir()
-        (sync_a / "admin_folder" / "sub" / "nested.txt").write_text("Nested")
-        do_sync(cli_runner, config_a)
+        build_tree(
+            sync_a,
+            {
+                "admin_folder": {
+                    "file1.txt": "File 1",
+                    "file2.txt": "File 2",
+                    "sub": {"nested.txt": "Nested"},
+                }
+            },
+        )
+        sync_client_fast(config_a)
 
         # Verify files exist
-        assert (sync_a / "admin_folder" / "file1.txt").exists()
-        assert (sync_a / "admin_folder" / "file2.txt").exists()
-        assert (sync_a / "admin_folder" / "sub" / "nested.txt").exists()
+        assert_file(sync_a / "admin_folder" / "file1.txt", "File 1")
+        assert_file(sync_a / "admin_folder" / "file2.txt", "File 2")
+        assert_file(sync_a / "admin_folder" / "sub" / "nested.txt", "Nested")
 
         # Admin deletes folder via server (using smart delete_file)
         deleted_count = test_server.db.delete_file("admin_folder", machine_id=None)
         assert deleted_count == 3  # All 3 files deleted
 
         # Client syncs again
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # All files should be removed locally
-        assert not (sync_a / "admin_folder" / "file1.txt").exists()
-        assert not (sync_a / "admin_folder" / "file2.txt").exists()
-        assert not (sync_a / "admin_folder" / "sub" / "nested.txt").exists()
+        assert_file(sync_a / "admin_folder" / "file1.txt", None)
+        assert_file(sync_a / "admin_folder" / "file2.txt", None)
+        assert_file(sync_a / "admin_folder" / "sub" / "nested.txt", None)
+        # Emptied directories are pruned too
+        assert not (sync_a / "admin_folder").exists()
 
     def test_admin_delete_propagates_to_multiple_clients(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        paired_clients: PairedClients,
         test_server: TestServer,
     ) -> None:
         """Admin deletion should propagate to all connected clients."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(
-            cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a
-        )
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Client A uploads a file
         (sync_a / "shared_file.txt").write_text("Shared content")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Client B syncs to get the file
-        do_sync(cli_runner, config_b)
-        assert (sync_b / "shared_file.txt").exists()
+        sync_client_fast(config_b)
+        assert_file(sync_b / "shared_file.txt", "Shared content")
 
         # Admin deletes via server
         test_server.db.delete_file("shared_file.txt", machine_id=None)
 
         # Both clients sync
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        sync_all([config_a, config_b])
 
         # File should be removed on both clients
-        assert not (sync_a / "shared_file.txt").exists()
-        assert not (sync_b / "shared_file.txt").exists()
+        assert_file(sync_a / "shared_file.txt", None)
+        assert_file(sync_b / "shared_file.txt", None)
 
 
 class TestRestoreFromTrash:
@@ -400,72 +378,62 @@ class TestRestoreFromTrash:
 
     def test_restore_file_syncs_to_client(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Admin restores file from trash → client syncs and gets file back."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Client uploads a file
         (sync_a / "restore_me.txt").write_text("Restore this content")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Admin deletes via server
         test_server.db.delete_file("restore_me.txt", machine_id=None)
 
         # Client syncs - file should be removed
-        do_sync(cli_runner, config_a)
-        assert not (sync_a / "restore_me.txt").exists()
+        sync_client_fast(config_a)
+        assert_file(sync_a / "restore_me.txt", None)
 
         # Admin restores from trash
         restored = test_server.db.restore_file_by_path("restore_me.txt", machine_id=None)
         assert restored
 
         # Client syncs again - file should be back
-        do_sync(cli_runner, config_a)
-        assert (sync_a / "restore_me.txt").exists()
-        assert (sync_a / "restore_me.txt").read_text() == "Restore this content"
+        sync_client_fast(config_a)
+        assert_file(sync_a / "restore_me.txt", "Restore this content")
 
     def test_restore_propagates_to_multiple_clients(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        paired_clients: PairedClients,
         test_server: TestServer,
     ) -> None:
         """Restored file should propagate to all connected clients."""
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(
-            cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a
-        )
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Client A uploads a file
         (sync_a / "shared_restore.txt").write_text("Shared content")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Client B syncs to get the file
-        do_sync(cli_runner, config_b)
-        assert (sync_b / "shared_restore.txt").exists()
+        sync_client_fast(config_b)
+        assert_file(sync_b / "shared_restore.txt", "Shared content")
 
         # Admin deletes via server
         test_server.db.delete_file("shared_restore.txt", machine_id=None)
 
         # Both clients sync - file removed
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
-        assert not (sync_a / "shared_restore.txt").exists()
-        assert not (sync_b / "shared_restore.txt").exists()
+        sync_all([config_a, config_b])
+        assert_file(sync_a / "shared_restore.txt", None)
+        assert_file(sync_b / "shared_restore.txt", None)
 
         # Admin restores
         test_server.db.restore_file_by_path("shared_restore.txt", machine_id=None)
 
         # Both clients sync - file should be back
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
-        assert (sync_a / "shared_restore.txt").exists()
-        assert (sync_b / "shared_restore.txt").exists()
-        assert (sync_a / "shared_restore.txt").read_text() == "Shared content"
-        assert (sync_b / "shared_restore.txt").read_text() == "Shared content"
+        sync_all([config_a, config_b])
+        assert_file(sync_a / "shared_restore.txt", "Shared content")
+        assert_file(sync_b / "shared_restore.txt", "Shared content")
 
 
 class TestWatchModeRemotePolling:
@@ -478,8 +446,7 @@ class TestWatchModeRemotePolling:
 
     def test_fetch_remote_changes_detects_admin_delete(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """ChangeScanner should detect admin deletions via /api/changes."""
@@ -488,17 +455,16 @@ class TestWatchModeRemotePolling:
         from syncagent.client.sync import ChangeScanner
         from syncagent.core.config import ServerConfig
 
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Upload a file
         (sync_a / "watch_delete.txt").write_text("To be deleted")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Setup scanner
         from syncagent.client.cli.config import load_config
 
-        with PatchedCLI(config_a):
-            config = load_config()
+        config = load_config(config_a)
 
         server_config = ServerConfig(
             server_url=config["server_url"], token=config["auth_token"]
@@ -519,8 +485,7 @@ class TestWatchModeRemotePolling:
 
     def test_fetch_remote_changes_detects_admin_restore(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """ChangeScanner should detect restored files via /api/changes."""
@@ -529,22 +494,21 @@ class TestWatchModeRemotePolling:
         from syncagent.client.sync import ChangeScanner
         from syncagent.core.config import ServerConfig
 
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Upload and delete a file
         (sync_a / "watch_restore.txt").write_text("To be restored")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Admin deletes
         test_server.db.delete_file("watch_restore.txt", machine_id=None)
-        do_sync(cli_runner, config_a)  # Client processes deletion
-        assert not (sync_a / "watch_restore.txt").exists()
+        sync_client_fast(config_a)  # Client processes deletion
+        assert_file(sync_a / "watch_restore.txt", None)
 
         # Setup scanner
         from syncagent.client.cli.config import load_config
 
-        with PatchedCLI(config_a):
-            config = load_config()
+        config = load_config(config_a)
 
         server_config = ServerConfig(
             server_url=config["server_url"], token=config["auth_token"]
@@ -565,8 +529,7 @@ class TestWatchModeRemotePolling:
 
     def test_emit_events_queues_remote_changes(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        client_dirs: ClientDirs,
         test_server: TestServer,
     ) -> None:
         """emit_events should queue remote changes from polling."""
@@ -608,8 +571,7 @@ class TestWatchModeRemotePolling:
 
     def test_watch_mode_integration_delete(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Full integration: admin delete while client in watch-like mode.
@@ -630,19 +592,18 @@ class TestWatchModeRemotePolling:
         from syncagent.client.sync.types import SyncEventType
         from syncagent.core.config import ServerConfig
 
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Upload a file via normal sync
         (sync_a / "live_delete.txt").write_text("Will be deleted live")
-        do_sync(cli_runner, config_a)
-        assert (sync_a / "live_delete.txt").exists()
+        sync_client_fast(config_a)
+        assert_file(sync_a / "live_delete.txt", "Will be deleted live")
 
         # Setup components for "watch mode simulation"
         from syncagent.client.cli.config import load_config
 
-        with PatchedCLI(config_a):
-            config = load_config()
-            keystore = load_keystore("testpassword", config_a)
+        config = load_config(config_a)
+        keystore = load_keystore("testpassword", config_a)
 
         server_config = ServerConfig(
             server_url=config["server_url"], token=config["auth_token"]
@@ -694,12 +655,11 @@ class TestWatchModeRemotePolling:
         pool.stop()
 
         # File should be deleted locally
-        assert not (sync_a / "live_delete.txt").exists()
+        assert_file(sync_a / "live_delete.txt", None)
 
     def test_watch_mode_integration_restore(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Full integration: admin restore while client in watch-like mode."""
@@ -717,24 +677,23 @@ class TestWatchModeRemotePolling:
         from syncagent.client.sync.types import SyncEventType
         from syncagent.core.config import ServerConfig
 
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Upload a file
         original_content = "Restore this content in watch mode"
         (sync_a / "live_restore.txt").write_text(original_content)
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Admin deletes
         test_server.db.delete_file("live_restore.txt", machine_id=None)
-        do_sync(cli_runner, config_a)
-        assert not (sync_a / "live_restore.txt").exists()
+        sync_client_fast(config_a)
+        assert_file(sync_a / "live_restore.txt", None)
 
         # Setup watch mode components
         from syncagent.client.cli.config import load_config
 
-        with PatchedCLI(config_a):
-            config = load_config()
-            keystore = load_keystore("testpassword", config_a)
+        config = load_config(config_a)
+        keystore = load_keystore("testpassword", config_a)
 
         server_config = ServerConfig(
             server_url=config["server_url"], token=config["auth_token"]
@@ -783,5 +742,4 @@ class TestWatchModeRemotePolling:
         pool.stop()
 
         # File should be restored
-        assert (sync_a / "live_restore.txt").exists()
-        assert (sync_a / "live_restore.txt").read_text() == original_content
+        assert_file(sync_a / "live_restore.txt", original_content)
@@ -9,6 +9,7 @@ Test Scenarios:
 
 export-key:
     - [x] Exports base64-encoded key
+    - [x] --json prints only {"key": ...} on stdout
     - [x] Requires master password
     - [x] Fails if not initialized
     - [x] Fails with wrong password
@@ -29,27 +30,36 @@ Cross-device workflow:
 from __future__ import annotations
 
 import base64
+import json
 import os
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
 from syncagent.client.keystore import load_keystore
-from tests.integration.cli.fixtures import PatchedCLI, init_client
+from tests.integration.cli.fixtures import CliEnv, init_client
+
+
+@pytest.fixture(scope="module")
+def fresh_key() -> tuple[bytes, str]:
+    """Random 32-byte key and its base64 encoding, shared by the module."""
+    key_bytes = os.urandom(32)
+    return key_bytes, base64.b64encode(key_bytes).decode()
 
 
 class TestExportKey:
     """Tests for export-key command."""
 
-    def test_exports_base64_key(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_exports_base64_key(self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path) -> None:
         """Export should return a valid base64-encoded 32-byte key."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
 
         assert result.exit_code == 0
         # Extract key from output (last non-empty line)
@@ -60,40 +70,57 @@ class TestExportKey:
         decoded = base64.b64decode(exported_key)
         assert len(decoded) == 32
 
-    def test_requires_password(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_exports_json(self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path) -> None:
+        """Export with --json should print only the key object on stdout."""
+        config_dir = tmp_path / ".syncagent"
+        sync_folder = tmp_path / "sync"
+        init_client(config_dir, sync_folder)
+
+        cli_env(config_dir)
+        result = cli_runner.invoke(
+            cli, ["export-key", "--json"], input="testpassword\n"
+        )
+
+        assert result.exit_code == 0
+        assert "Enter master password" in result.stderr
+        exported = json.loads(result.stdout)
+        assert list(exported) == ["key"]
+        assert exported["key"] == load_keystore("testpassword", config_dir).export_key()
+
+    def test_requires_password(self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path) -> None:
         """Export should prompt for password."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
 
         assert "Enter master password" in result.output
 
     def test_fails_if_not_initialized(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path
     ) -> None:
         """Export should fail if not initialized."""
         config_dir = tmp_path / ".syncagent"
         config_dir.mkdir(parents=True)
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["export-key"])
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["export-key"])
 
         assert result.exit_code == 1
         assert "not initialized" in result.output.lower()
 
     def test_fails_with_wrong_password(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path
     ) -> None:
         """Export should fail with wrong password."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["export-key"], input="wrongpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["export-key"], input="wrongpassword\n")
 
         assert result.exit_code == 1
         assert "invalid password" in result.output.lower()
@@ -103,29 +130,26 @@ class TestImportKey:
     """Tests for import-key command."""
 
     def test_imports_key_successfully(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path, fresh_key: tuple[bytes, str]
     ) -> None:
         """Import should succeed with valid key."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        # Generate a valid key
-        new_key = base64.b64encode(os.urandom(32)).decode()
-
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(
-                cli, ["import-key", new_key], input="testpassword\n"
-            )
+        cli_env(config_dir)
+        result = cli_runner.invoke(
+            cli, ["import-key", fresh_key[1]], input="testpassword\n"
+        )
 
         assert result.exit_code == 0
         assert "imported successfully" in result.output.lower()
 
-    def test_changes_key_id(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_changes_key_id(self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path) -> None:
         """Import should change the key ID."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
         # Get original key ID
         original_keystore = load_keystore("testpassword", config_dir)
@@ -133,95 +157,89 @@ class TestImportKey:
 
         # Import new key
         new_key = base64.b64encode(os.urandom(32)).decode()
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", new_key], input="testpassword\n")
+        cli_env(config_dir)
+        cli_runner.invoke(cli, ["import-key", new_key], input="testpassword\n")
 
         # Verify key ID changed
         new_keystore = load_keystore("testpassword", config_dir)
         assert new_keystore.key_id != original_key_id
 
     def test_persists_across_reload(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path, fresh_key: tuple[bytes, str]
     ) -> None:
         """Imported key should persist and be loadable."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        # Generate and import key
-        key_bytes = os.urandom(32)
-        new_key = base64.b64encode(key_bytes).decode()
+        key_bytes, new_key = fresh_key
 
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", new_key], input="testpassword\n")
+        cli_env(config_dir)
+        cli_runner.invoke(cli, ["import-key", new_key], input="testpassword\n")
 
         # Reload keystore and verify key matches
         keystore = load_keystore("testpassword", config_dir)
         assert keystore.encryption_key == key_bytes
 
     def test_fails_if_not_initialized(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path, fresh_key: tuple[bytes, str]
     ) -> None:
         """Import should fail if not initialized."""
         config_dir = tmp_path / ".syncagent"
         config_dir.mkdir(parents=True)
 
-        new_key = base64.b64encode(os.urandom(32)).decode()
-
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["import-key", new_key])
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["import-key", fresh_key[1]])
 
         assert result.exit_code == 1
         assert "not initialized" in result.output.lower()
 
     def test_fails_with_wrong_password(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path, fresh_key: tuple[bytes, str]
     ) -> None:
         """Import should fail with wrong password."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        new_key = base64.b64encode(os.urandom(32)).decode()
-
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(
-                cli, ["import-key", new_key], input="wrongpassword\n"
-            )
+        cli_env(config_dir)
+        result = cli_runner.invoke(
+            cli, ["import-key", fresh_key[1]], input="wrongpassword\n"
+        )
 
         assert result.exit_code == 1
         assert "invalid password" in result.output.lower()
 
     def test_fails_with_invalid_base64(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path
     ) -> None:
         """Import should fail with invalid base64."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(
-                cli, ["import-key", "not-valid-base64!!!"], input="testpassword\n"
-            )
+        cli_env(config_dir)
+        result = cli_runner.invoke(
+            cli, ["import-key", "not-valid-base64!!!"], input="testpassword\n"
+        )
 
         assert result.exit_code == 1
         assert "invalid key" in result.output.lower()
 
     def test_fails_with_wrong_key_length(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path
     ) -> None:
         """Import should fail if key is not 32 bytes."""
         config_dir = tmp_path / ".syncagent"
         sync_folder = tmp_path / "sync"
-        init_client(cli_runner, config_dir, sync_folder)
+        init_client(config_dir, sync_folder)
 
         short_key = base64.b64encode(b"tooshort").decode()
 
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(
-                cli, ["import-key", short_key], input="testpassword\n"
-            )
+        cli_env(config_dir)
+        result = cli_runner.invoke(
+            cli, ["import-key", short_key], input="testpassword\n"
+        )
 
         assert result.exit_code == 1
         assert "32 bytes" in result.output
@@ -231,30 +249,31 @@ class TestCrossDeviceWorkflow:
     """Tests for export/import workflow between devices."""
 
     def test_export_import_enables_sync(
-        self, cli_runner: CliRunner, tmp_path: Path
+        self, cli_runner: CliRunner, cli_env: CliEnv, tmp_path: Path
     ) -> None:
         """Key exported from A and imported to B should match."""
         # Setup device A
         config_a = tmp_path / "device_a" / ".syncagent"
         sync_a = tmp_path / "device_a" / "sync"
-        init_client(cli_runner, config_a, sync_a)
+        init_client(config_a, sync_a)
 
         # Export key from A
-        with PatchedCLI(config_a):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-        lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-        exported_key = lines[-1]
+        cli_env(config_a)
+        result = cli_runner.invoke(
+            cli, ["export-key", "--json"], input="testpassword\n"
+        )
+        exported_key = json.loads(result.stdout)["key"]
 
         # Setup device B
         config_b = tmp_path / "device_b" / ".syncagent"
         sync_b = tmp_path / "device_b" / "sync"
-        init_client(cli_runner, config_b, sync_b)
+        init_client(config_b, sync_b)
 
         # Import key to B
-        with PatchedCLI(config_b):
-            result = cli_runner.invoke(
-                cli, ["import-key", exported_key], input="testpassword\n"
-            )
+        cli_env(config_b)
+        result = cli_runner.invoke(
+            cli, ["import-key", exported_key], input="testpassword\n"
+        )
         assert result.exit_code == 0
 
         # Verify both have same encryption key
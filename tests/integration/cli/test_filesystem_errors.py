@@ -28,8 +28,7 @@ import pytest
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
-from tests.integration.conftest import TestServer
+from tests.integration.cli.fixtures import PatchedCLI, bulk_write
 
 
 class TestFileAccessErrors:
@@ -38,16 +37,10 @@ class TestFileAccessErrors:
     def test_handles_file_deleted_during_scan(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Should handle file being deleted between scan and upload."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create and immediately delete a file
         test_file = sync_folder / "ephemeral.txt"
@@ -62,52 +55,30 @@ class TestFileAccessErrors:
         # Should not crash
         assert result.exit_code == 0
 
-    def test_handles_empty_file(
+    @pytest.mark.parametrize(
+        "files",
+        [
+            pytest.param({"empty.txt": ""}, id="empty"),
+            pytest.param({"Makefile": "all: build", "README": "Read me"}, id="no-extension"),
+            pytest.param({".hidden": "Hidden content", ".gitignore": "*.log"}, id="hidden"),
+        ],
+    )
+    def test_syncs_unusual_files(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
+        files: dict[str, str],
     ) -> None:
-        """Should sync empty files correctly."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        # Create empty file
-        (sync_folder / "empty.txt").write_text("")
-
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-
-        assert result.exit_code == 0
-        # Empty file should be synced
-        assert "empty.txt" in result.output or "uploaded" in result.output
-
-    def test_handles_file_no_extension(
-        self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
-    ) -> None:
-        """Should sync files without extension."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        # Create file without extension
-        (sync_folder / "Makefile").write_text("all: build")
-        (sync_folder / "README").write_text("Read me")
+        """Empty, extensionless and hidden (dot) files should upload like any other."""
+        config_dir, sync_folder = registered_client
+        bulk_write(sync_folder, files)
 
         with PatchedCLI(config_dir):
             result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
         assert result.exit_code == 0
+        for name in files:
+            assert f"↑ {name}" in result.output
 
 
 class TestSpecialFiles:
@@ -117,16 +88,10 @@ class TestSpecialFiles:
     def test_handles_symlinks(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Should handle symlinks appropriately (skip or follow)."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create regular file and symlink
         (sync_folder / "real.txt").write_text("Real file")
@@ -139,43 +104,13 @@ class TestSpecialFiles:
         # Should not crash (symlink handling is implementation-defined)
         assert result.exit_code == 0
 
-    def test_handles_hidden_files(
-        self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
-    ) -> None:
-        """Should handle hidden files (dot files)."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        # Create hidden file
-        (sync_folder / ".hidden").write_text("Hidden content")
-        (sync_folder / ".gitignore").write_text("*.log")
-
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-
-        # Should not crash
-        assert result.exit_code == 0
-
     def test_handles_deeply_nested_directories(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Should handle deeply nested directory structures."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create nested structure (10 levels deep)
         nested_path = sync_folder
@@ -198,16 +133,10 @@ class TestPermissionErrors:
     def test_handles_unreadable_file(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Should handle files without read permission."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create file and remove read permission
         test_file = sync_folder / "noperm.txt"
@@ -228,16 +157,10 @@ class TestPermissionErrors:
     def test_handles_readable_file_normal(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Normal readable files should sync without issues."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create normal readable file
         (sync_folder / "readable.txt").write_text("Normal content")
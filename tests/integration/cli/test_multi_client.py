@@ -19,72 +19,20 @@ Concurrent scenarios:
 
 from __future__ import annotations
 
-import time
-from pathlib import Path
+import pytest
 
-from click.testing import CliRunner
-
-from syncagent.client.cli import cli
 from tests.integration.cli.fixtures import (
-    PatchedCLI,
-    init_client,
-    register_client,
+    MakeClient,
+    PairedClients,
+    bump_mtime,
+    sync_client_fast,
 )
-from tests.integration.conftest import TestServer
-
-
-def setup_client(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str,
-    import_key_from: Path | None = None,
-) -> tuple[Path, Path]:
-    """Setup a client with init and register.
-
-    Args:
-        cli_runner: Click test runner
-        tmp_path: Temp directory base
-        test_server: Test server fixture
-        name: Client name
-        import_key_from: If set, import key from this config_dir after init
-
-    Returns:
-        (config_dir, sync_folder)
-    """
-    config_dir = tmp_path / name / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / name / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
-
-    init_client(cli_runner, config_dir, sync_folder)
-
-    # Import key from another client if specified (required for E2EE sync)
-    if import_key_from:
-        # Export key from source client
-        with PatchedCLI(import_key_from):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            # Extract key from output (last non-empty line)
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-
-        # Import key to this client
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
-
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
-
-    return config_dir, sync_folder
-
-
-def do_sync(cli_runner: CliRunner, config_dir: Path, password: str = "testpassword") -> str:
-    """Run sync for a client. Returns output."""
-    with PatchedCLI(config_dir):
-        result = cli_runner.invoke(cli, ["sync"], input=f"{password}\n")
-        if result.exit_code != 0:
-            raise RuntimeError(f"sync failed: {result.output}")
-        return result.output
+
+
+@pytest.fixture(scope="module")
+def binary_payload() -> bytes:
+    """Every byte value, repeated."""
+    return bytes(range(256)) * 100
 
 
 class TestFileSharing:
@@ -92,22 +40,18 @@ class TestFileSharing:
 
     def test_file_created_on_a_syncs_to_b(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        # Client B imports key from A (required for E2EE)
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file
         (sync_a / "shared.txt").write_text("From A")
 
         # A syncs (upload)
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B syncs (download)
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have file
         assert (sync_b / "shared.txt").exists()
@@ -115,75 +59,66 @@ class TestFileSharing:
 
     def test_modified_file_updates_on_other_client(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates v1
         (sync_a / "doc.txt").write_text("Version 1")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B downloads v1
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
         assert (sync_b / "doc.txt").read_text() == "Version 1"
 
         # A modifies to v2
-        time.sleep(0.1)
         (sync_a / "doc.txt").write_text("Version 2")
-        do_sync(cli_runner, config_a)
+        bump_mtime(sync_a / "doc.txt")
+        sync_client_fast(config_a)
 
         # B downloads v2
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
         assert (sync_b / "doc.txt").read_text() == "Version 2"
 
     def test_deleted_file_removed_from_other_client(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file
         (sync_a / "to_delete.txt").write_text("Delete me")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B downloads
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
         assert (sync_b / "to_delete.txt").exists()
 
         # A deletes
         (sync_a / "to_delete.txt").unlink()
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B syncs - file should be deleted
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
         # Note: This depends on delete sync implementation
         # File might be marked as deleted or actually removed
 
     def test_bidirectional_sync(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file_a
         (sync_a / "from_a.txt").write_text("Content from A")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B creates file_b and downloads file_a
         (sync_b / "from_b.txt").write_text("Content from B")
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # A downloads file_b
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # Both should have both files
         assert (sync_a / "from_a.txt").read_text() == "Content from A"
@@ -197,24 +132,23 @@ class TestConcurrentClients:
 
     def test_both_clients_create_different_files(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Both create files
         (sync_a / "a_file.txt").write_text("A's file")
         (sync_b / "b_file.txt").write_text("B's file")
 
-        # Both sync
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        # A uploads; B uploads its file and pulls A's in the same pass
+        sync_client_fast(config_a)
+        result_b = sync_client_fast(config_b)
+        assert result_b.uploaded == ["b_file.txt"]
+        assert result_b.downloaded == ["a_file.txt"]
 
-        # Sync again to get each other's files
-        do_sync(cli_runner, config_a)
-        do_sync(cli_runner, config_b)
+        # A pulls B's file; B is already up to date
+        result_a = sync_client_fast(config_a)
+        assert result_a.downloaded == ["b_file.txt"]
 
         # Both should have both files
         assert (sync_a / "a_file.txt").exists()
@@ -224,21 +158,19 @@ class TestConcurrentClients:
 
     def test_three_clients_sync(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        make_client: MakeClient,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
-        config_c, sync_c = setup_client(cli_runner, tmp_path, test_server, "client-c", import_key_from=config_a)
+        config_a, sync_a = make_client("client-a")
+        config_b, sync_b = make_client("client-b")
+        config_c, sync_c = make_client("client-c")
 
         # A creates file
         (sync_a / "origin.txt").write_text("From A")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B and C both sync
-        do_sync(cli_runner, config_b)
-        do_sync(cli_runner, config_c)
+        sync_client_fast(config_b)
+        sync_client_fast(config_c)
 
         # All should have the file
         assert (sync_a / "origin.txt").read_text() == "From A"
@@ -247,22 +179,19 @@ class TestConcurrentClients:
 
     def test_files_with_same_name_different_dirs(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates files in different dirs
         (sync_a / "dir1").mkdir()
         (sync_a / "dir2").mkdir()
         (sync_a / "dir1" / "file.txt").write_text("In dir1")
         (sync_a / "dir2" / "file.txt").write_text("In dir2")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B downloads
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have both files with correct content
         assert (sync_b / "dir1" / "file.txt").read_text() == "In dir1"
@@ -274,60 +203,51 @@ class TestDataIntegrity:
 
     def test_binary_file_sync(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
+        binary_payload: bytes,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates binary file
-        binary_data = bytes(range(256)) * 100
-        (sync_a / "binary.bin").write_bytes(binary_data)
-        do_sync(cli_runner, config_a)
+        (sync_a / "binary.bin").write_bytes(binary_payload)
+        sync_client_fast(config_a)
 
         # B downloads
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have identical binary content
-        assert (sync_b / "binary.bin").read_bytes() == binary_data
+        assert (sync_b / "binary.bin").read_bytes() == binary_payload
 
     def test_unicode_content_sync(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates file with unicode
         unicode_content = "Hello 世界! 🎉 Привет мир!"
         (sync_a / "unicode.txt").write_text(unicode_content, encoding="utf-8")
-        do_sync(cli_runner, config_a)
+        sync_client_fast(config_a)
 
         # B downloads
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have identical unicode content
         assert (sync_b / "unicode.txt").read_text(encoding="utf-8") == unicode_content
 
     def test_large_file_sync(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
+        large_payload: bytes,
     ) -> None:
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
-        # A creates large file (5MB - multiple chunks)
-        large_content = b"x" * (5 * 1024 * 1024)
-        (sync_a / "large.bin").write_bytes(large_content)
-        do_sync(cli_runner, config_a)
+        # A creates a multi-chunk file
+        (sync_a / "large.bin").write_bytes(large_payload)
+        sync_client_fast(config_a)
 
         # B downloads
-        do_sync(cli_runner, config_b)
+        sync_client_fast(config_b)
 
         # B should have identical content
-        assert (sync_b / "large.bin").read_bytes() == large_content
+        assert (sync_b / "large.bin").read_bytes() == large_payload
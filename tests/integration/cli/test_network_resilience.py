@@ -7,11 +7,11 @@ Test Scenarios:
 
 Server unreachable:
     - [x] Shows "Server unreachable" message
-    - [x] Waits for server to come back online
+    - [ ] Waits for server to come back online
     - [x] Resumes sync when server available
 
 Retry behavior:
-    - [x] Retries with exponential backoff
+    - [ ] Retries with exponential backoff
     - [x] Continues after transient failure
 
 Transfer resilience:
@@ -21,15 +21,43 @@ Transfer resilience:
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import httpx
+import pytest
 from click.testing import CliRunner
 
+from syncagent.client.api import HTTPClient
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
-from tests.integration.conftest import TestServer
+from syncagent.client.sync import retry
+from tests.integration.cli.fixtures import PatchedCLI, bulk_write
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retry backoff and network waits return immediately.
+
+    Only the retry module's view of 'time' is replaced, so the test server
+    and the rest of the client keep the real time.sleep.
+    """
+    monkeypatch.setattr(retry, "time", SimpleNamespace(sleep=lambda _seconds: None))
+
+
+class RefuseFirstTransport(httpx.HTTPTransport):
+    """Network transport whose first request fails with a connection error."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls == 1:
+            raise httpx.ConnectError("Connection refused", request=request)
+        return super().handle_request(request)
 
 
 class TestServerUnreachable:
@@ -38,90 +66,41 @@ class TestServerUnreachable:
     def test_shows_server_unreachable_message(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Should show message when server is unreachable."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
         # Create a file to sync
         (sync_folder / "test.txt").write_text("Content")
 
-        # Mock the HTTP client to simulate connection error on first call
-        call_count = [0]
-        original_get = httpx.Client.get
-
-        def mock_get(self, *args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise httpx.ConnectError("Connection refused")
-            return original_get(self, *args, **kwargs)
+        # Refuse the sync client's first connection, then reach the server
+        transport = RefuseFirstTransport()
+        client_factory = partial(HTTPClient, transport=transport)
 
         # Run sync with simulated network error
         # Due to the retry logic, this test verifies the error is handled
-        with PatchedCLI(config_dir), patch.object(httpx.Client, "get", mock_get):
+        with PatchedCLI(config_dir), patch("syncagent.client.api.HTTPClient", client_factory):
             result = cli_runner.invoke(
                 cli, ["sync"], input="testpassword\n", catch_exceptions=False
             )
 
+        assert transport.calls > 1
         # Should either show unreachable message or succeed after retry
         # The exact behavior depends on how fast the mock recovers
         assert result.exit_code == 0 or "unreachable" in result.output.lower()
 
-    def test_waits_for_server_recovery(
-        self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
-    ) -> None:
+    @pytest.mark.skip(reason="placeholder: needs server outage injection, see docs/cli/network-resilience.md")
+    def test_waits_for_server_recovery(self) -> None:
         """Should wait and retry when server comes back online."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        # Create file
-        (sync_folder / "recovery.txt").write_text("Recovery test")
-
-        # Run normal sync - should succeed
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-
-        assert result.exit_code == 0
-        assert "recovery.txt" in result.output or "uploaded" in result.output
 
 
 class TestRetryBehavior:
     """Tests for retry and backoff behavior."""
 
-    def test_retries_on_transient_failure(
-        self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
-    ) -> None:
+    @pytest.mark.skip(reason="placeholder: needs backoff timing checks, see docs/cli/network-resilience.md")
+    def test_retries_on_transient_failure(self) -> None:
         """Should retry and succeed after transient failure."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        (sync_folder / "transient.txt").write_text("Transient test")
-
-        # Sync should succeed normally (testing the success path)
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-
-        assert result.exit_code == 0
 
 
 class TestTransferResilience:
@@ -130,20 +109,13 @@ class TestTransferResilience:
     def test_handles_large_file_upload(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
+        large_payload: bytes,
     ) -> None:
         """Large file upload should work with chunking."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
-        # Create a larger file (2MB - will be chunked)
-        large_content = b"x" * (2 * 1024 * 1024)
-        (sync_folder / "large.bin").write_bytes(large_content)
+        (sync_folder / "large.bin").write_bytes(large_payload)
 
         with PatchedCLI(config_dir):
             result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
@@ -154,50 +126,26 @@ class TestTransferResilience:
     def test_handles_multiple_files(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Multiple concurrent file uploads should work."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
+        config_dir, sync_folder = registered_client
 
-        # Create multiple files
-        for i in range(10):
-            (sync_folder / f"file{i}.txt").write_text(f"Content {i}")
+        # Three files are enough to keep several uploads in flight
+        files = {f"file{i}.txt": f"Content {i}" for i in range(3)}
+        bulk_write(sync_folder, files)
 
         with PatchedCLI(config_dir):
             result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
         assert result.exit_code == 0
-        # Should mention uploads
-        assert "uploaded" in result.output.lower()
+        for name in files:
+            assert f"↑ {name}" in result.output
 
 
 class TestTimeoutHandling:
     """Tests for timeout scenarios."""
 
-    def test_handles_slow_server(
-        self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
-    ) -> None:
+    @pytest.mark.skip(reason="placeholder: needs slow response injection, see docs/cli/network-resilience.md")
+    def test_handles_slow_server(self) -> None:
         """Should handle slow server responses."""
-        config_dir = tmp_path / ".syncagent"
-        sync_folder = tmp_path / "sync"
-        sync_folder.mkdir(parents=True)
-        init_client(cli_runner, config_dir, sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, config_dir, test_server.url, token, "test-client")
-
-        (sync_folder / "slow.txt").write_text("Slow test")
-
-        # Normal sync should work
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-
-        assert result.exit_code == 0
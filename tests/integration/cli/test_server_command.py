@@ -21,50 +21,46 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
 
 
+@pytest.fixture(scope="module")
+def server_help() -> str:
+    """Help text of the 'server' command, rendered once for the option checks."""
+    command = cli.commands["server"]
+    return command.get_help(click.Context(command, info_name="server"))
+
+
 class TestServerStartup:
     """Tests for server command startup."""
 
-    def test_server_command_exists(self, cli_runner: CliRunner) -> None:
+    def test_server_command_exists(self, server_help: str) -> None:
         """Server command should be available."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
+        assert "Start the SyncAgent server" in server_help
 
-        assert result.exit_code == 0
-        assert "Start the SyncAgent server" in result.output
-
-    def test_shows_port_option(self, cli_runner: CliRunner) -> None:
+    def test_shows_port_option(self, server_help: str) -> None:
         """Server should accept --port option."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
-
-        assert "--port" in result.output or "-p" in result.output
+        assert "--port" in server_help or "-p" in server_help
 
-    def test_shows_host_option(self, cli_runner: CliRunner) -> None:
+    def test_shows_host_option(self, server_help: str) -> None:
         """Server should accept --host option."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
+        assert "--host" in server_help or "-h" in server_help
 
-        assert "--host" in result.output or "-h" in result.output
-
-    def test_shows_db_path_option(self, cli_runner: CliRunner) -> None:
+    def test_shows_db_path_option(self, server_help: str) -> None:
         """Server should accept --db-path option."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
-
-        assert "--db-path" in result.output
+        assert "--db-path" in server_help
 
-    def test_shows_storage_path_option(self, cli_runner: CliRunner) -> None:
+    def test_shows_storage_path_option(self, server_help: str) -> None:
         """Server should accept --storage-path option."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
+        assert "--storage-path" in server_help
 
-        assert "--storage-path" in result.output
-
-    def test_shows_reload_option(self, cli_runner: CliRunner) -> None:
+    def test_shows_reload_option(self, server_help: str) -> None:
         """Server should accept --reload option."""
-        result = cli_runner.invoke(cli, ["server", "--help"])
-
-        assert "--reload" in result.output
+        assert "--reload" in server_help
 
     def test_starts_server_with_custom_paths(
         self, cli_runner: CliRunner, tmp_path: Path
@@ -35,11 +35,8 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import (
-    PatchedCLI,
-    init_client,
-    register_client,
-)
+from syncagent.client.state import LocalSyncState
+from tests.integration.cli.fixtures import CliEnv, bulk_write, init_client
 from tests.integration.conftest import TestServer
 
 
@@ -49,44 +46,43 @@ class TestSyncPrerequisites:
     def test_fails_if_not_initialized(
         self,
         cli_runner: CliRunner,
+        cli_env: CliEnv,
         test_config_dir: Path,
     ) -> None:
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(test_config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 1
-            assert "not initialized" in result.output.lower()
+        assert result.exit_code == 1
+        assert "not initialized" in result.output.lower()
 
     def test_fails_if_not_registered(
         self,
         cli_runner: CliRunner,
+        cli_env: CliEnv,
         test_config_dir: Path,
         test_sync_folder: Path,
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
+        init_client(test_config_dir, test_sync_folder)
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(test_config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 1
-            assert "not registered" in result.output.lower()
+        assert result.exit_code == 1
+        assert "not registered" in result.output.lower()
 
     def test_fails_with_wrong_password(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "pwd-test")
+        config_dir, _ = registered_client
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="wrongpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="wrongpassword\n")
 
-            assert result.exit_code == 1
-            assert "error" in result.output.lower()
+        assert result.exit_code == 1
+        assert "error" in result.output.lower()
 
 
 class TestSyncUpload:
@@ -95,87 +91,73 @@ class TestSyncUpload:
     def test_uploads_new_file(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "upload-test")
+        config_dir, sync_folder = registered_client
 
-        (test_sync_folder / "hello.txt").write_text("Hello!")
+        (sync_folder / "hello.txt").write_text("Hello!")
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0, f"sync failed: {result.output}"
-            assert "hello.txt" in result.output
+        assert result.exit_code == 0, f"sync failed: {result.output}"
+        assert "hello.txt" in result.output
 
     def test_uploads_multiple_files(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "multi-test")
+        config_dir, sync_folder = registered_client
 
-        (test_sync_folder / "file1.txt").write_text("File 1")
-        (test_sync_folder / "file2.txt").write_text("File 2")
-        (test_sync_folder / "file3.txt").write_text("File 3")
+        bulk_write(sync_folder, {"file1.txt": "File 1", "file2.txt": "File 2", "file3.txt": "File 3"})
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0
-            assert "file1.txt" in result.output
-            assert "file2.txt" in result.output
-            assert "file3.txt" in result.output
+        assert result.exit_code == 0
+        assert "file1.txt" in result.output
+        assert "file2.txt" in result.output
+        assert "file3.txt" in result.output
 
     def test_uploads_files_in_subdirectories(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "subdir-test")
+        config_dir, sync_folder = registered_client
 
-        subdir = test_sync_folder / "docs" / "reports"
+        subdir = sync_folder / "docs" / "reports"
         subdir.mkdir(parents=True)
         (subdir / "report.txt").write_text("Report content")
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0
-            assert "report.txt" in result.output
+        assert result.exit_code == 0
+        assert "report.txt" in result.output
 
     def test_no_reupload_unchanged_files(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "noreup-test")
+        config_dir, sync_folder = registered_client
 
-        (test_sync_folder / "stable.txt").write_text("Stable content")
+        (sync_folder / "stable.txt").write_text("Stable content")
 
-        with PatchedCLI(test_config_dir):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0
-            # Second sync may still report 1 upload (known issue with watcher)
-            # but should not show errors
-            assert "error" not in result.output.lower() or "0 errors" in result.output.lower()
+        assert result.exit_code == 0
+        # Second sync may still report 1 upload (known issue with watcher)
+        # but should not show errors
+        assert "error" not in result.output.lower() or "0 errors" in result.output.lower()
 
 
 class TestSyncOutput:
@@ -184,70 +166,59 @@ class TestSyncOutput:
     def test_shows_server_url(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
         test_server: TestServer,
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "url-test")
+        config_dir, _ = registered_client
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert test_server.url in result.output
+        assert test_server.url in result.output
 
     def test_shows_sync_folder(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "folder-test")
+        config_dir, sync_folder = registered_client
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert str(test_sync_folder) in result.output
+        assert str(sync_folder) in result.output
 
     def test_shows_summary(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "summary-test")
+        config_dir, sync_folder = registered_client
 
-        (test_sync_folder / "file.txt").write_text("Content")
+        (sync_folder / "file.txt").write_text("Content")
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0
-            assert "uploaded" in result.output.lower() or "sync complete" in result.output.lower()
+        assert result.exit_code == 0
+        assert "uploaded" in result.output.lower() or "sync complete" in result.output.lower()
 
     def test_shows_up_to_date(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "empty-test")
+        config_dir, _ = registered_client
 
-        with PatchedCLI(test_config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert result.exit_code == 0
-            assert "up to date" in result.output.lower()
+        assert result.exit_code == 0
+        assert "up to date" in result.output.lower()
 
 
 class TestSyncState:
@@ -256,39 +227,32 @@ class TestSyncState:
     def test_creates_state_db(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "state-test")
+        config_dir, _ = registered_client
 
-        with PatchedCLI(test_config_dir):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            assert (test_config_dir / "state.db").exists()
+        assert (config_dir / "state.db").exists()
 
     def test_tracks_uploaded_files(
         self,
         cli_runner: CliRunner,
-        test_config_dir: Path,
-        test_sync_folder: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        init_client(cli_runner, test_config_dir, test_sync_folder)
-        token = test_server.create_invitation()
-        register_client(cli_runner, test_config_dir, test_server.url, token, "track-test")
+        config_dir, sync_folder = registered_client
 
-        (test_sync_folder / "tracked.txt").write_text("Track me")
+        (sync_folder / "tracked.txt").write_text("Track me")
 
-        with PatchedCLI(test_config_dir):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        cli_env(config_dir)
+        cli_runner.invoke(cli, ["sync"], input="testpassword\n")
 
-            from syncagent.client.state import LocalSyncState
-            state = LocalSyncState(test_config_dir / "state.db")
-            tracked = state.get_file("tracked.txt")
-            state.close()
+        state = LocalSyncState(config_dir / "state.db")
+        tracked = state.get_file("tracked.txt")
+        state.close()
 
-            assert tracked is not None
-            assert tracked.server_version >= 1
+        assert tracked is not None
+        assert tracked.server_version >= 1
@@ -24,16 +24,31 @@ concurrent/threaded scenarios well (it modifies global interpreter state).
 from __future__ import annotations
 
 import os
+import signal
 import subprocess
 import sys
-import time
+import threading
 from pathlib import Path
 
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
-from tests.integration.conftest import TestServer
+from tests.integration.cli.fixtures import (
+    CliEnv,
+    PairedClients,
+    assert_file,
+    bulk_write,
+    bump_mtime,
+    sync_client_fast,
+)
+
+REPO_ROOT = Path(__file__).parents[3]
+
+# Runs the CLI with the same fast KDF as the in-process tests (see tests.fast_kdf)
+WATCH_MAIN = (
+    "import tests.fast_kdf; tests.fast_kdf.install(); "
+    "from syncagent.client.cli import main; main()"
+)
 
 
 class TestWatchModeOptions:
@@ -54,30 +69,10 @@ class TestWatchModeOptions:
         assert "--no-progress" in result.output
 
 
-def setup_registered_client(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str = "test-client",
-) -> tuple[Path, Path]:
-    """Setup and register a client for testing."""
-    config_dir = tmp_path / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
-
-    init_client(cli_runner, config_dir, sync_folder)
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
-
-    return config_dir, sync_folder
-
-
 def run_sync_watch_subprocess(
     config_dir: Path,
     sync_folder: Path,
     password: str = "testpassword",
-    timeout: float = 10.0,
 ) -> subprocess.Popen:
     """Start sync --watch in a subprocess.
 
@@ -86,16 +81,20 @@ def run_sync_watch_subprocess(
     env = os.environ.copy()
     env["SYNCAGENT_CONFIG_DIR"] = str(config_dir)
     env["SYNCAGENT_SYNC_FOLDER"] = str(sync_folder)
+    # The keyfile was written with the fast test KDF, so the child needs it too
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
 
-    # Use subprocess to run the CLI properly
+    # Use subprocess to run the CLI properly. A new session has no controlling
+    # terminal, so the password prompt reads from stdin instead of /dev/tty.
     proc = subprocess.Popen(
-        [sys.executable, "-m", "syncagent.client.cli", "sync", "--watch"],
+        [sys.executable, "-c", WATCH_MAIN, "sync", "--watch"],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
         env=env,
         cwd=str(config_dir.parent),
+        start_new_session=True,
     )
 
     # Send password
@@ -106,94 +105,97 @@ def run_sync_watch_subprocess(
     return proc
 
 
+def read_until(proc: subprocess.Popen, marker: str, timeout: float = 10.0) -> str:
+    """Read the subprocess output until a line contains marker.
+
+    Returns everything read so far, whether or not the marker showed up
+    before the timeout.
+    """
+    lines: list[str] = []
+    found = threading.Event()
+
+    def reader() -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            lines.append(line)
+            if marker in line:
+                found.set()
+                return
+
+    threading.Thread(target=reader, daemon=True).start()
+    found.wait(timeout)
+    return "".join(lines)
+
+
 class TestWatchModeStartup:
     """Tests for watch mode initialization using actual sync process."""
 
-    def test_shows_watching_message(
+    def test_shows_watching_message_and_stops_on_sigint(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        registered_client: tuple[Path, Path],
     ) -> None:
-        """Watch mode should show 'Watching for changes...' after initial sync."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
-
-        # Run sync --watch briefly to check output
-        with PatchedCLI(config_dir):
-            # Use CliRunner but with catch_exceptions to see partial output
-            # We use a threading approach but with controlled timeout
-            import queue
-            import threading
-
-            result_queue: queue.Queue = queue.Queue()
-
-            def run_watch():
-                result = cli_runner.invoke(
-                    cli,
-                    ["sync", "--watch"],
-                    input="testpassword\n",
-                )
-                result_queue.put(result.output)
-
-            thread = threading.Thread(target=run_watch)
-            thread.start()
-
-            # Wait briefly for watch to start
-            time.sleep(3.0)
-
-            # Thread will be stuck, but we can check if watcher started by
-            # looking at what files were created (state.db, etc.)
-            # Since we can't easily get partial output, check artifacts
-            state_db = config_dir / "state.db"
-            assert state_db.exists(), "State DB should be created during sync"
-
-            # Try to join with timeout - thread may hang in watch loop
-            thread.join(timeout=1.0)
-            # We expect the thread is still running (watching)
+        """Watch mode should show 'Watching for changes...' and stop cleanly on Ctrl+C.
+
+        The only test that needs a real process: SIGINT handling cannot be
+        exercised through CliRunner.
+        """
+        config_dir, sync_folder = registered_client
+
+        proc = run_sync_watch_subprocess(config_dir, sync_folder)
+        try:
+            output = read_until(proc, "Watching for changes")
+
+            assert "Watching for changes" in output, output
+            # The initial sync ran before the watch loop started
+            assert (config_dir / "state.db").exists()
+
+            proc.send_signal(signal.SIGINT)
+            rest, _ = proc.communicate(timeout=10)
+
+            assert "Stopping..." in rest
+            assert proc.returncode == 0
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
 
     def test_performs_initial_sync_before_watching(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Watch mode should sync existing files before entering watch loop."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Create file BEFORE starting watch
         (sync_folder / "existing.txt").write_text("Existed before watch")
 
         # Run normal sync first to upload
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            assert "existing.txt" in result.output or "uploaded" in result.output
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        assert "existing.txt" in result.output or "uploaded" in result.output
 
     def test_initial_sync_uploads_files(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Files present when watch starts should be synced."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Create files
         (sync_folder / "file1.txt").write_text("Content 1")
         (sync_folder / "file2.txt").write_text("Content 2")
 
         # First sync (simulating initial sync of watch mode)
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            # Files should be uploaded
-            assert "uploaded" in result.output.lower()
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        # Files should be uploaded
+        assert "uploaded" in result.output.lower()
 
 
 class TestFileEventDetection:
@@ -208,102 +210,90 @@ class TestFileEventDetection:
     def test_detects_new_file_creation(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Watcher should detect newly created files."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Initial sync (nothing to sync)
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
+        sync_client_fast(config_dir)
 
         # Create new file
         (sync_folder / "newfile.txt").write_text("New content")
 
         # Sync again - should detect the new file
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            assert "newfile.txt" in result.output or "uploaded" in result.output
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        assert "newfile.txt" in result.output or "uploaded" in result.output
 
     def test_detects_file_modification(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Watcher should detect modified files."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Create and sync initial file
         (sync_folder / "modify.txt").write_text("Original content")
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_dir)
 
         # Modify the file
-        time.sleep(0.1)  # Ensure mtime changes
         (sync_folder / "modify.txt").write_text("Modified content")
+        bump_mtime(sync_folder / "modify.txt")
 
         # Sync again - should detect modification
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            # Should upload the modified file
-            assert "modify.txt" in result.output or "uploaded" in result.output
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        # Should upload the modified file
+        assert "modify.txt" in result.output or "uploaded" in result.output
 
     def test_handles_multiple_file_changes(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Watcher should handle multiple simultaneous file changes."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Initial sync
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_dir)
 
         # Create multiple files
         for i in range(5):
             (sync_folder / f"batch{i}.txt").write_text(f"Batch content {i}")
 
         # Sync should handle all
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            # Should show multiple uploads
-            assert "uploaded" in result.output.lower()
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        # Should show multiple uploads
+        assert "uploaded" in result.output.lower()
 
     def test_detects_file_in_subdirectory(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        cli_env: CliEnv,
+        registered_client: tuple[Path, Path],
     ) -> None:
         """Watcher should detect files in subdirectories."""
-        config_dir, sync_folder = setup_registered_client(
-            cli_runner, tmp_path, test_server
-        )
+        config_dir, sync_folder = registered_client
 
         # Create subdirectory and file
         (sync_folder / "subdir").mkdir()
         (sync_folder / "subdir" / "nested.txt").write_text("Nested content")
 
         # Sync should detect nested file
-        with PatchedCLI(config_dir):
-            result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
-            assert result.exit_code == 0
-            # Nested file should be synced
-            assert "nested.txt" in result.output or "uploaded" in result.output
+        cli_env(config_dir)
+        result = cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        assert result.exit_code == 0
+        # Nested file should be synced
+        assert "nested.txt" in result.output or "uploaded" in result.output
 
 
 class TestWatchModeWithTwoClients:
@@ -314,113 +304,48 @@ class TestWatchModeWithTwoClients:
 
     def test_changes_propagate_between_clients(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Changes from one client should be visible to another."""
-        # Setup two clients with same key
-        config_a = tmp_path / "client_a" / ".syncagent"
-        config_a.mkdir(parents=True)
-        sync_a = tmp_path / "client_a" / "sync"
-        sync_a.mkdir(parents=True)
-
-        config_b = tmp_path / "client_b" / ".syncagent"
-        config_b.mkdir(parents=True)
-        sync_b = tmp_path / "client_b" / "sync"
-        sync_b.mkdir(parents=True)
-
-        # Init both
-        init_client(cli_runner, config_a, sync_a)
-        init_client(cli_runner, config_b, sync_b)
-
-        # Export key from A, import to B
-        with PatchedCLI(config_a):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-
-        with PatchedCLI(config_b):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
-
-        # Register both
-        token_a = test_server.create_invitation()
-        register_client(cli_runner, config_a, test_server.url, token_a, "client-a")
-
-        token_b = test_server.create_invitation()
-        register_client(cli_runner, config_b, test_server.url, token_b, "client-b")
+        # Two clients sharing the template's encryption key
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # A creates and syncs file
         (sync_a / "shared.txt").write_text("From A")
-        with PatchedCLI(config_a):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_a)
 
         # B syncs to get file (simulating watch mode polling)
-        with PatchedCLI(config_b):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_b)
 
         # B should have the file
-        assert (sync_b / "shared.txt").exists()
-        assert (sync_b / "shared.txt").read_text() == "From A"
+        assert_file(sync_b / "shared.txt", "From A")
 
     def test_bidirectional_sync_like_watch_mode(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
-        test_server: TestServer,
+        paired_clients: PairedClients,
     ) -> None:
         """Simulate watch mode with bidirectional changes."""
-        # Setup two clients
-        config_a = tmp_path / "client_a" / ".syncagent"
-        config_a.mkdir(parents=True)
-        sync_a = tmp_path / "client_a" / "sync"
-        sync_a.mkdir(parents=True)
-
-        config_b = tmp_path / "client_b" / ".syncagent"
-        config_b.mkdir(parents=True)
-        sync_b = tmp_path / "client_b" / "sync"
-        sync_b.mkdir(parents=True)
-
-        init_client(cli_runner, config_a, sync_a)
-        init_client(cli_runner, config_b, sync_b)
-
-        # Share key
-        with PatchedCLI(config_a):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-
-        with PatchedCLI(config_b):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
-
-        # Register
-        token_a = test_server.create_invitation()
-        register_client(cli_runner, config_a, test_server.url, token_a, "client-a")
-        token_b = test_server.create_invitation()
-        register_client(cli_runner, config_b, test_server.url, token_b, "client-b")
+        # Two clients sharing the template's encryption key
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Simulate watch mode with alternating syncs
         # Round 1: A creates file
         (sync_a / "from_a.txt").write_text("A's file")
-        with PatchedCLI(config_a):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_a)
 
         # Round 2: B syncs and creates its own file
-        with PatchedCLI(config_b):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_b)
         (sync_b / "from_b.txt").write_text("B's file")
-        with PatchedCLI(config_b):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_b)
 
         # Round 3: A syncs to get B's file
-        with PatchedCLI(config_a):
-            cli_runner.invoke(cli, ["sync"], input="testpassword\n")
+        sync_client_fast(config_a)
 
         # Both should have both files
-        assert (sync_a / "from_a.txt").read_text() == "A's file"
-        assert (sync_a / "from_b.txt").read_text() == "B's file"
-        assert (sync_b / "from_a.txt").read_text() == "A's file"
-        assert (sync_b / "from_b.txt").read_text() == "B's file"
+        assert_file(sync_a / "from_a.txt", "A's file")
+        assert_file(sync_a / "from_b.txt", "B's file")
+        assert_file(sync_b / "from_a.txt", "A's file")
+        assert_file(sync_b / "from_b.txt", "B's file")
 
 
 class TestFileWatcherUnit:
@@ -456,18 +381,17 @@ class TestFileWatcherUnit:
         sync_folder.mkdir()
 
         queue = EventQueue()
-        watcher = FileWatcher(sync_folder, queue)
+        watcher = FileWatcher(sync_folder, queue, sync_delay_s=0.1)
         watcher.start()
 
         try:
             # Create file
             (sync_folder / "test.txt").write_text("Test content")
 
-            # Wait for event to be detected
-            time.sleep(0.5)
-
-            # Check if event was queued (may or may not depending on timing)
-            # The key is that creating the file doesn't crash
+            # Blocks until the (debounced) event is queued
+            event = queue.get(timeout=5.0)
+            assert event is not None
+            assert event.path == "test.txt"
         finally:
             watcher.stop()
 
@@ -482,17 +406,20 @@ class TestFileWatcherUnit:
         sync_folder.mkdir()
 
         queue = EventQueue()
-        watcher = FileWatcher(sync_folder, queue)
+        watcher = FileWatcher(sync_folder, queue, sync_delay_s=0.1)
         watcher.start()
 
         try:
-            # Create many files rapidly
-            for i in range(10):
-                (sync_folder / f"rapid{i}.txt").write_text(f"Content {i}")
-
-            # Wait for events
-            time.sleep(1.0)
-
-            # Should not crash, queue should have events
+            # Create many files rapidly, back to back
+            files = {f"rapid{i}.txt": f"Content {i}" for i in range(10)}
+            bulk_write(sync_folder, files)
+
+            # The burst is flushed once the sync delay expires: every file
+            # gets an event
+            queued: set[str] = set()
+            while queued != set(files):
+                event = queue.get(timeout=5.0)
+                assert event is not None, f"missing events for {set(files) - queued}"
+                queued.add(event.path)
         finally:
             watcher.stop()
@@ -29,39 +29,10 @@ from click.testing import CliRunner
 from syncagent.client.cli import cli
 from syncagent.client.sync import EventQueue, RemoteChangeListener, SyncEventType
 from syncagent.core.config import ServerConfig
-from tests.integration.cli.fixtures import PatchedCLI, init_client, register_client
+from tests.integration.cli.fixtures import MakeClient, PairedClients, PatchedCLI
 from tests.integration.conftest import TestServer
 
 
-def setup_client(
-    cli_runner: CliRunner,
-    tmp_path: Path,
-    test_server: TestServer,
-    name: str,
-    import_key_from: Path | None = None,
-) -> tuple[Path, Path]:
-    """Setup a client for testing."""
-    config_dir = tmp_path / name / ".syncagent"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    sync_folder = tmp_path / name / "sync"
-    sync_folder.mkdir(parents=True, exist_ok=True)
-
-    init_client(cli_runner, config_dir, sync_folder)
-
-    if import_key_from:
-        with PatchedCLI(import_key_from):
-            result = cli_runner.invoke(cli, ["export-key"], input="testpassword\n")
-            lines = [line.strip() for line in result.output.split("\n") if line.strip()]
-            exported_key = lines[-1]
-        with PatchedCLI(config_dir):
-            cli_runner.invoke(cli, ["import-key", exported_key], input="testpassword\n")
-
-    token = test_server.create_invitation()
-    register_client(cli_runner, config_dir, test_server.url, token, name)
-
-    return config_dir, sync_folder
-
-
 def do_sync(cli_runner: CliRunner, config_dir: Path) -> str:
     """Run sync and return output."""
     with PatchedCLI(config_dir):
@@ -78,13 +49,12 @@ class TestWebSocketPushNotifications:
     async def test_delete_triggers_push_notification(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
+        paired_clients: PairedClients,
         test_server: TestServer,
     ) -> None:
         """Admin delete should send push notification via WebSocket."""
         # Setup two clients - A will listen, B (or admin) will delete
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Client A uploads a file
         (sync_a / "push_test.txt").write_text("Delete via other client")
@@ -144,7 +114,7 @@ class TestWebSocketPushNotifications:
     def test_remote_listener_receives_push_events(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
+        paired_clients: PairedClients,
         test_server: TestServer,
     ) -> None:
         """RemoteChangeListener should receive push events and emit to queue."""
@@ -154,8 +124,7 @@ class TestWebSocketPushNotifications:
         from syncagent.client.state import LocalSyncState
 
         # Setup two clients - A will listen, B will delete
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
-        config_b, sync_b = setup_client(cli_runner, tmp_path, test_server, "client-b", import_key_from=config_a)
+        (config_a, sync_a), (config_b, sync_b) = paired_clients
 
         # Client A uploads a file
         (sync_a / "listener_test.txt").write_text("Test content")
@@ -213,14 +182,14 @@ class TestWebSocketPushNotifications:
     def test_listener_fetches_missed_changes_on_reconnect(
         self,
         cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """RemoteChangeListener should fetch missed changes on reconnect."""
         from syncagent.client.api import HTTPClient
         from syncagent.client.state import LocalSyncState
 
-        config_a, sync_a = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, sync_a = make_client("client-a")
 
         # Upload a file
         (sync_a / "reconnect_test.txt").write_text("Test content")
@@ -274,14 +243,13 @@ class TestServerMachineVisibility:
 
     def test_server_machine_hidden_from_list(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Server machine should not appear in machines list."""
         import httpx
 
-        config_a, _ = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, _ = make_client("client-a")
 
         # Ensure server machine exists by triggering an admin operation
         test_server.db.get_or_create_server_machine()
@@ -308,14 +276,13 @@ class TestServerMachineVisibility:
 
     def test_server_machine_cannot_be_deleted(
         self,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        make_client: MakeClient,
         test_server: TestServer,
     ) -> None:
         """Server machine should not be deletable."""
         import httpx
 
-        config_a, _ = setup_client(cli_runner, tmp_path, test_server, "client-a")
+        config_a, _ = make_client("client-a")
 
         # Get or create server machine
         server_machine = test_server.db.get_or_create_server_machine()
@@ -6,9 +6,11 @@ running in-memory with local filesystem storage.
 
 from __future__ import annotations
 
+import os
+import shutil
 import threading
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,15 +18,19 @@ from typing import Any
 import pytest
 import uvicorn
 from httpx import Client
+from sqlalchemy import event
 
 from syncagent.client.api import HTTPClient
 from syncagent.client.state import LocalSyncState
 from syncagent.client.sync import ChangeScanner, FileDownloader, FileUploader
+from syncagent.core.chunking import chunk_bytes
 from syncagent.core.config import ServerConfig
-from syncagent.core.crypto import derive_key, generate_salt
+from syncagent.core.crypto import encrypt_chunk
 from syncagent.server.app import create_app
 from syncagent.server.database import Database
+from syncagent.server.models import Base
 from syncagent.server.storage import LocalFSStorage
+from syncagent.server.ws import StatusHub, set_hub
 
 
 @dataclass
@@ -35,6 +41,7 @@ class TestServer:
 
     db: Database
     storage: LocalFSStorage
+    storage_path: Path
     url: str
     thread: threading.Thread
 
@@ -43,6 +50,43 @@ class TestServer:
         raw_token, _ = self.db.create_invitation()
         return raw_token
 
+    def register_machine(self, name: str, platform: str = "test") -> str:
+        """Register a machine directly in the database.
+
+        Skips the invitation/HTTP round-trip of 'syncagent register' for
+        tests that only need a valid machine token.
+
+        Returns:
+            Raw authentication token for the machine.
+        """
+        machine = self.db.create_machine(name, platform)
+        raw_token, _ = self.db.create_token(machine.id)
+        return raw_token
+
+    def seed_chunks(self, payloads: Iterable[bytes], encryption_key: bytes) -> None:
+        """Store encrypted chunks for payloads as if a client had uploaded them.
+
+        Clients check chunk_exists() before encrypting and uploading, so
+        syncing a seeded payload only exercises the metadata path.
+        """
+        for payload in payloads:
+            for chunk in chunk_bytes(payload):
+                self.storage.put(chunk.hash, encrypt_chunk(chunk.data, encryption_key))
+
+    def reset(self) -> None:
+        """Drop all server state left by a previous test.
+
+        Deletes every row in one transaction, empties chunk storage and
+        installs a fresh StatusHub, so the running server looks new.
+        """
+        with self.db._engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+        shutil.rmtree(self.storage_path, ignore_errors=True)
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        # Other tests' create_app() calls replace the global hub
+        set_hub(StatusHub())
+
     def stop(self) -> None:
         """Stop the server (best effort - uvicorn doesn't have clean shutdown)."""
         # The thread will be cleaned up when the test ends
@@ -137,20 +181,45 @@ class UvicornTestServer:
 
 @pytest.fixture
 def encryption_key() -> bytes:
-    """Generate a shared encryption key for all test clients."""
-    salt = generate_salt()
-    return derive_key("integration-test-password", salt)
+    """Generate a shared encryption key for all test clients.
 
+    A random key, like create_keystore() generates: deriving it from a
+    password would only add an Argon2 run per test.
+    """
+    return os.urandom(32)
+
+
+def relax_synchronous(db: Database) -> None:
+    """Use PRAGMA synchronous=NORMAL on every connection of a test database.
+
+    Production keeps SQLite's default FULL, which fsyncs the WAL on every
+    commit. Test databases are thrown away, so durability across a power
+    loss does not matter there.
+    """
+
+    @event.listens_for(db._engine, "connect")
+    def _set_synchronous(dbapi_conn: Any, _record: Any) -> None:
+        dbapi_conn.execute("PRAGMA synchronous=NORMAL")
+
+    # synchronous is per connection: drop those opened before the listener
+    db._engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def shared_server(tmp_path_factory: pytest.TempPathFactory) -> Generator[TestServer]:
+    """Start one test server per session (per worker under pytest-xdist).
+
+    The server binds an OS-assigned port and keeps its files in a session
+    temp directory. Tests use it through the test_server fixture, which
+    resets it first.
+    """
+    server_dir = tmp_path_factory.mktemp("server")
 
-@pytest.fixture
-def test_server(tmp_path: Path) -> Generator[TestServer]:
-    """Create and start a test server with in-memory DB and local storage."""
     # Create database and storage
-    db_path = tmp_path / "server" / "test.db"
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    db = Database(db_path)
+    db = Database(server_dir / "test.db")
+    relax_synchronous(db)
 
-    storage_path = tmp_path / "server" / "chunks"
+    storage_path = server_dir / "chunks"
     storage = LocalFSStorage(storage_path)
 
     # Create FastAPI app
@@ -164,6 +233,7 @@ def test_server(tmp_path: Path) -> Generator[TestServer]:
     yield TestServer(
         db=db,
         storage=storage,
+        storage_path=storage_path,
         url=url,
         thread=server.thread,  # type: ignore
     )
@@ -173,6 +243,17 @@ def test_server(tmp_path: Path) -> Generator[TestServer]:
     db.close()
 
 
+@pytest.fixture
+def test_server(shared_server: TestServer) -> TestServer:
+    """Provide the session test server with a clean database and storage.
+
+    Resetting (a few DELETE statements) replaces starting a new uvicorn
+    server for each test.
+    """
+    shared_server.reset()
+    return shared_server
+
+
 @pytest.fixture
 def client_factory(
     tmp_path: Path,
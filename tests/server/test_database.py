@@ -205,6 +205,31 @@ class TestFileMetadataOperations:
         assert file is not None
         assert file.deleted_at is not None
 
+    def test_delete_folder(self, db: Database) -> None:
+        """Deleting a folder path should trash every file under it."""
+        machine = db.create_machine("test", "Linux")
+        db.create_file("docs/a.txt", 100, "h1", machine.id)
+        db.create_file("docs/sub/b.txt", 100, "h2", machine.id)
+        db.create_file("docsx/c.txt", 100, "h3", machine.id)
+        assert db.delete_file("docs", machine.id) == 2
+        assert [f.path for f in db.list_files()] == ["docsx/c.txt"]
+        for path in ("docs/a.txt", "docs/sub/b.txt"):
+            file = db.get_file(path)
+            assert file is not None
+            assert file.deleted_at is not None
+            assert file.version == 2
+
+    def test_delete_folder_logs_changes(self, db: Database) -> None:
+        """Folder deletion should log one DELETED change per file."""
+        machine = db.create_machine("test", "Linux")
+        db.create_file("docs/a.txt", 100, "h1", machine.id)
+        db.create_file("docs/b.txt", 100, "h2", machine.id)
+        since = datetime.now(UTC) - timedelta(seconds=1)
+        assert db.delete_folder("docs/", None) == 2
+        deleted = [c for c in db.get_changes_since(since) if c.action == "DELETED"]
+        assert sorted(c.file_path for c in deleted) == ["docs/a.txt", "docs/b.txt"]
+        assert db.delete_folder("docs/", None) == 0
+
     def test_list_trash(self, db: Database) -> None:
         """Should list deleted files."""
         machine = db.create_machine("test", "Linux")
@@ -132,6 +132,28 @@ class TestStatusHub:
         assert status is not None
         assert status.state == SyncState.OFFLINE
 
+    @pytest.mark.asyncio
+    async def test_disconnect_of_replaced_connection_is_ignored(
+        self, hub: StatusHub, mock_ws: MagicMock
+    ) -> None:
+        """A late disconnect of the old connection should not drop the new one."""
+        old_ws = MagicMock()
+        old_ws.accept = AsyncMock()
+        old_ws.close = AsyncMock()
+        old_ws.client_state = WebSocketState.CONNECTED
+
+        await hub.connect_client(old_ws, machine_id=1, machine_name="test")
+        await hub.connect_client(mock_ws, machine_id=1, machine_name="test")
+        await hub.disconnect_client(1, old_ws)
+
+        status = await hub.get_status(1)
+        assert status is not None
+        assert status.state == SyncState.IDLE
+
+        # The new connection still receives pushes
+        await hub.notify_file_change("DELETED", "a.txt", datetime.now(UTC).isoformat())
+        mock_ws.send_text.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_connect_dashboard(self, hub: StatusHub, mock_ws: MagicMock) -> None:
         """Should register dashboard and send current status."""
@@ -7,6 +7,7 @@ import pytest
 from click.testing import CliRunner
 
 from syncagent.client.cli import cli
+from tests.fast_kdf import patch_derive_key
 
 
 @pytest.fixture
@@ -15,6 +16,12 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def fast_kdf(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace Argon2 with the fast test KDF (Argon2 is covered by test_crypto.py)."""
+    patch_derive_key(monkeypatch)
+
+
 @pytest.fixture
 def config_dir(tmp_path: Path) -> Path:
     """Create a temporary config directory."""
@@ -204,3 +211,28 @@ class TestImportKeyCommand:
             )
 
         assert result.exit_code == 0
+
+
+class TestConfigDir:
+    """Tests for config directory resolution."""
+
+    def test_defaults_to_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without override, the config dir should be ~/.syncagent."""
+        from syncagent.client.cli.config import CONFIG_DIR_ENV, get_config_dir
+
+        monkeypatch.delenv(CONFIG_DIR_ENV, raising=False)
+        assert get_config_dir() == Path.home() / ".syncagent"
+
+    def test_env_override(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """SYNCAGENT_CONFIG_DIR should redirect every command."""
+        from syncagent.client.cli.config import CONFIG_DIR_ENV
+
+        monkeypatch.setenv(CONFIG_DIR_ENV, str(tmp_path / "custom"))
+        result = runner.invoke(
+            cli, ["init"], input=f"password\npassword\n{tmp_path / 'sync'}\n"
+        )
+        assert result.exit_code == 0
+        assert (tmp_path / "custom" / "keyfile.json").exists()
+        assert (tmp_path / "custom" / "config.json").exists()
@@ -12,6 +12,13 @@ from syncagent.client.keystore import (
     create_keystore,
     load_keystore,
 )
+from tests.fast_kdf import patch_derive_key
+
+
+@pytest.fixture(autouse=True)
+def fast_kdf(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace Argon2 with the fast test KDF (Argon2 is covered by test_crypto.py)."""
+    patch_derive_key(monkeypatch)
 
 
 class TestKeyStoreCreation:
@@ -162,6 +169,20 @@ class TestKeyExportImport:
         with pytest.raises(KeyStoreError, match="Invalid key"):
             keystore.import_key("not-valid-base64!!!", "password")
 
+    def test_import_key_rejects_stray_characters(self, tmp_path: Path) -> None:
+        """A valid key with a character outside the base64 alphabet is rejected."""
+        keystore = create_keystore("password", tmp_path)
+        exported = keystore.export_key()
+        with pytest.raises(KeyStoreError, match="not valid base64"):
+            keystore.import_key(exported[:10] + "!" + exported[10:], "password")
+
+    def test_import_key_ignores_surrounding_whitespace(self, tmp_path: Path) -> None:
+        """A pasted key with a trailing newline should still import."""
+        key = b"k" * 32
+        keystore = create_keystore("password", tmp_path)
+        keystore.import_key(base64.b64encode(key).decode() + "\n", "password")
+        assert keystore.encryption_key == key
+
     def test_import_wrong_length_key_fails(self, tmp_path: Path) -> None:
         """Import should fail if key is not 32 bytes."""
         import base64
@@ -201,3 +222,19 @@ class TestKeyStoreKeyId:
         keystore.import_key(new_key, "password")
 
         assert keystore.key_id != original_id
+
+
+class TestKeyStoreKeyDerivation:
+    """Tests for master key derivation."""
+
+    def test_every_unlock_runs_kdf(self, tmp_path: Path) -> None:
+        """Derived master keys should never be cached between unlocks."""
+        from syncagent.client import keystore as keystore_module
+
+        create_keystore("password", tmp_path)
+
+        with patch.object(keystore_module, "derive_key", wraps=keystore_module.derive_key) as kdf:
+            load_keystore("password", tmp_path)
+            load_keystore("password", tmp_path)
+
+        assert kdf.call_count == 2